@@ -1,5 +1,6 @@
 import os
 from collections.abc import AsyncIterator, Iterator
+from functools import cached_property
 from typing import Any, Literal
 
 import aioboto3
@@ -68,60 +69,54 @@ class BedrockClient(Client):
         self.memory_adapter = BedrockMemoryAdapter()
         self._set_client()
 
+    def _session_kwargs(self) -> dict[str, str]:
+        session_kwargs = {}
+
+        # Priority: explicit credentials > profile > default credentials
+        if self.aws_access_key_id and self.aws_secret_access_key:
+            session_kwargs["aws_access_key_id"] = self.aws_access_key_id
+            session_kwargs["aws_secret_access_key"] = self.aws_secret_access_key
+            if self.aws_session_token:
+                session_kwargs["aws_session_token"] = self.aws_session_token
+        elif self.profile_name:
+            session_kwargs["profile_name"] = self.profile_name
+
+        return session_kwargs
+
+    @staticmethod
+    def _client_config() -> Config:
+        # Create bedrock-runtime client with retry configuration
+        return Config(
+            retries={"max_attempts": 3, "mode": "adaptive"},
+            read_timeout=300,
+        )
+
     def _set_client(self):
         if not self.client:
-            session_kwargs = {}
-
-            # Priority: explicit credentials > profile > default credentials
-            if self.aws_access_key_id and self.aws_secret_access_key:
-                session_kwargs["aws_access_key_id"] = self.aws_access_key_id
-                session_kwargs["aws_secret_access_key"] = self.aws_secret_access_key
-                if self.aws_session_token:
-                    session_kwargs["aws_session_token"] = self.aws_session_token
-            elif self.profile_name:
-                session_kwargs["profile_name"] = self.profile_name
-
-            session = boto3.Session(**session_kwargs)
-
-            # Create bedrock-runtime client with retry configuration
-            config = Config(
-                retries={"max_attempts": 3, "mode": "adaptive"},
-                read_timeout=300,
-            )
+            session = boto3.Session(**self._session_kwargs())
 
             self.client = session.client(
                 service_name="bedrock-runtime",
                 region_name=self.region_name,
-                config=config,
+                config=self._client_config(),
             )
 
-    def _set_a_client(self):
-        """Initialize async bedrock-runtime client using aioboto3"""
-        if not self.a_client:
-            session_kwargs = {}
-
-            # Priority: explicit credentials > profile > default credentials
-            if self.aws_access_key_id and self.aws_secret_access_key:
-                session_kwargs["aws_access_key_id"] = self.aws_access_key_id
-                session_kwargs["aws_secret_access_key"] = self.aws_secret_access_key
-                if self.aws_session_token:
-                    session_kwargs["aws_session_token"] = self.aws_session_token
-            elif self.profile_name:
-                session_kwargs["profile_name"] = self.profile_name
-
-            # Create async session
-            session = aioboto3.Session(**session_kwargs)
-
-            # Create bedrock-runtime client with retry configuration
-            config = Config(
-                retries={"max_attempts": 3, "mode": "adaptive"},
-                read_timeout=300,
-            )
+    @cached_property
+    def a_session(self) -> aioboto3.Session:
+        """Async aioboto3 session, built on the first async call."""
+        return aioboto3.Session(**self._session_kwargs())
 
-            # Store the session and config for async client creation
-            self.a_session = session
-            self.a_config = config
-            self.a_region_name = self.region_name
+    @cached_property
+    def a_config(self) -> Config:
+        return self._client_config()
+
+    @property
+    def a_region_name(self) -> str:
+        return self.region_name
+
+    def _set_a_client(self):
+        """Eagerly build the async session; async calls otherwise do it lazily."""
+        _ = self.a_session
 
     def _convert_tools(self, tools: list[Tool]) -> list[dict[str, Any]]:
         """Convert tools to Bedrock tool format (similar to Anthropic)"""
@@ -280,10 +275,6 @@ class BedrockClient(Client):
         if tools is None:
             tools = []
 
-        # Ensure async client is initialized
-        if not hasattr(self, "a_session"):
-            self._set_a_client()
-
         messages = self._memory_to_contents(None, input, memory)
 
         # Remove model role messages (Bedrock doesn't support this)
@@ -430,10 +421,6 @@ class BedrockClient(Client):
         if tools is None:
             tools = []
 
-        # Ensure async client is initialized
-        if not hasattr(self, "a_session"):
-            self._set_a_client()
-
         messages = self._memory_to_contents(None, input, memory)
 
         # Remove model role messages
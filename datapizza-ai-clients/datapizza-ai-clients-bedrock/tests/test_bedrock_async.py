@@ -1,45 +1,43 @@
+from functools import cached_property
+
+import pytest
+
 from datapizza.clients.bedrock import BedrockClient
 
 
-def test_async_client_initialization():
-    """Test that async client can be initialized"""
-    client = BedrockClient(
+@pytest.fixture(scope="module")
+def client():
+    """One client for the module: building a boto3 session is the slow part."""
+    return BedrockClient(
         aws_access_key_id="test_key",
         aws_secret_access_key="test_secret",
         region_name="us-east-1",
     )
 
+
+def test_async_client_initialization(client):
+    """Test that the async session is built lazily on first use"""
+    assert isinstance(BedrockClient.__dict__["a_session"], cached_property)
+    assert "a_session" not in client.__dict__
+
     # Initialize async client
     client._set_a_client()
 
     # Verify async session is created
-    assert hasattr(client, "a_session")
+    assert "a_session" in client.__dict__
     assert hasattr(client, "a_config")
-    assert hasattr(client, "a_region_name")
     assert client.a_region_name == "us-east-1"
 
 
-def test_a_invoke_method_exists():
+def test_a_invoke_method_exists(client):
     """Test that _a_invoke method is implemented and doesn't raise NotImplementedError"""
-    client = BedrockClient(
-        aws_access_key_id="test_key",
-        aws_secret_access_key="test_secret",
-        region_name="us-east-1",
-    )
-
     # Verify the method exists and is async
     assert hasattr(client, "_a_invoke")
     assert callable(client._a_invoke)
 
 
-def test_a_stream_invoke_method_exists():
+def test_a_stream_invoke_method_exists(client):
     """Test that _a_stream_invoke method is implemented and doesn't raise NotImplementedError"""
-    client = BedrockClient(
-        aws_access_key_id="test_key",
-        aws_secret_access_key="test_secret",
-        region_name="us-east-1",
-    )
-
     # Verify the method exists and is async
     assert hasattr(client, "_a_stream_invoke")
     assert callable(client._a_stream_invoke)
@@ -1,6 +1,14 @@
-import base64
-import json
-
+from collections.abc import Callable
+from typing import ClassVar
+
+from datapizza.memory.chat_format import (
+    AUDIO_HANDLERS,
+    IMAGE_HANDLERS,
+    application_url_prefix,
+    encode_path,
+    handler_for,
+    tool_call,
+)
 from datapizza.memory.memory import Turn
 from datapizza.memory.memory_adapter import MemoryAdapter
 from datapizza.type import (
@@ -13,50 +21,54 @@ from datapizza.type import (
 )
 
 
+def _pdf_from_base64(block: MediaBlock) -> dict:
+    media = block.media
+    return {
+        "type": "file",
+        "file": {
+            "filename": "file.pdf",
+            "file_data": application_url_prefix(media.extension) + media.source,
+        },
+    }
+
+
+def _pdf_from_path(block: MediaBlock) -> dict:
+    media = block.media
+    return {
+        "type": "file",
+        "file": {
+            "filename": "file.pdf",
+            "file_data": encode_path(
+                media.source, application_url_prefix(media.extension)
+            ),
+        },
+    }
+
+
+_PDF_HANDLERS: dict[str, Callable[[MediaBlock], dict]] = {
+    "base64": _pdf_from_base64,
+    "path": _pdf_from_path,
+}
+
+
 class OpenAILikeMemoryAdapter(MemoryAdapter):
     def _turn_to_message(self, turn: Turn) -> dict:
+        blocks = turn.blocks
+        if len(blocks) == 1 and type(blocks[0]) is TextBlock:
+            # Single-text turns are the common case and need no block loop
+            return {"role": turn.role.value, "content": blocks[0].content}
+
         content_blocks: list[dict] = []
         tool_calls = []
-        tool_call_id = None
         text_parts: list[str] = []
 
-        for block in turn:
-            block_dict = {}
-
-            match block:
-                case TextBlock():
-                    text_parts.append(block.content)
-                case StructuredBlock():
-                    text_parts.append(str(block.content))
-                case FunctionCallBlock():
-                    tool_calls.append(
-                        {
-                            "id": block.id,
-                            "function": {
-                                "name": block.name,
-                                "arguments": json.dumps(block.arguments),
-                            },
-                            "type": "function",
-                        }
-                    )
-                case FunctionCallResultBlock():
-                    tool_call_id = block.id
-                    text_parts.append(block.result)
-                case MediaBlock():
-                    match block.media.media_type:
-                        case "image":
-                            block_dict = self._process_image_block(block)
-                        case "pdf":
-                            block_dict = self._process_pdf_block(block)
-                        case "audio":
-                            block_dict = self._process_audio_block(block)
-                        case _:
-                            raise NotImplementedError(
-                                f"Unsupported media type: {block.media.media_type}"
-                            )
-
-            if block_dict:
-                content_blocks.append(block_dict)
+        for block in blocks:
+            handler = handler_for(self._BLOCK_HANDLERS, type(block))
+            if handler is None:
+                continue
+            tool_message = handler(self, block, text_parts, content_blocks, tool_calls)
+            if tool_message is not None:
+                return tool_message
 
         text_content = "".join(text_parts) if text_parts else None
 
@@ -71,103 +83,101 @@ class OpenAILikeMemoryAdapter(MemoryAdapter):
 
         if tool_calls:
             message["tool_calls"] = tool_calls
-        if tool_call_id:
-            message["tool_call_id"] = tool_call_id
 
         return message
 
+    def _handle_text_block(
+        self,
+        block: TextBlock,
+        text_parts: list[str],
+        content_blocks: list[dict],
+        tool_calls: list[dict],
+    ) -> None:
+        text_parts.append(block.content)
+
+    def _handle_structured_block(
+        self,
+        block: StructuredBlock,
+        text_parts: list[str],
+        content_blocks: list[dict],
+        tool_calls: list[dict],
+    ) -> None:
+        text_parts.append(str(block.content))
+
+    def _handle_function_call_block(
+        self,
+        block: FunctionCallBlock,
+        text_parts: list[str],
+        content_blocks: list[dict],
+        tool_calls: list[dict],
+    ) -> None:
+        tool_calls.append(tool_call(block))
+
+    def _handle_function_call_result_block(
+        self,
+        block: FunctionCallResultBlock,
+        text_parts: list[str],
+        content_blocks: list[dict],
+        tool_calls: list[dict],
+    ) -> dict:
+        # Tool output is its own message, nothing else in the turn is sent
+        return {
+            "role": "tool",
+            "tool_call_id": block.id,
+            "content": "" if block.result is None else str(block.result),
+        }
+
+    def _handle_media_block(
+        self,
+        block: MediaBlock,
+        text_parts: list[str],
+        content_blocks: list[dict],
+        tool_calls: list[dict],
+    ) -> None:
+        media_type = block.media.media_type
+        process = self._MEDIA_HANDLERS.get(media_type)
+        if process is None:
+            raise NotImplementedError(f"Unsupported media type: {media_type}")
+        block_dict = process(self, block)
+        if block_dict:
+            content_blocks.append(block_dict)
+
     def _process_audio_block(self, block: MediaBlock) -> dict:
-        match block.media.source_type:
-            case "path":
-                with open(block.media.source, "rb") as f:
-                    base64_audio = base64.b64encode(f.read()).decode("utf-8")
-                return {
-                    "type": "input_audio",
-                    "input_audio": {
-                        "data": base64_audio,
-                        "format": block.media.extension,
-                    },
-                }
-
-            case "base_64":
-                return {
-                    "type": "input_audio",
-                    "input_audio": {
-                        "data": block.media.source,
-                        "format": block.media.extension,
-                    },
-                }
-            case "raw":
-                base64_audio = base64.b64encode(block.media.source).decode("utf-8")
-                return {
-                    "type": "input_audio",
-                    "input_audio": {
-                        "data": base64_audio,
-                        "format": block.media.extension,
-                    },
-                }
-
-            case _:
-                raise NotImplementedError(
-                    f"Unsupported media source type: {block.media.source_type} for audio, source type supported: raw, path"
-                )
+        source_type = block.media.source_type
+        handler = AUDIO_HANDLERS.get(source_type)
+        if handler is None:
+            raise NotImplementedError(
+                f"Unsupported media source type: {source_type} for audio, source type supported: raw, path"
+            )
+        return handler(block)
 
     def _text_to_message(self, text: str, role: ROLE) -> dict:
         return {"role": role.value, "content": text}
 
     def _process_pdf_block(self, block: MediaBlock) -> dict:
-        match block.media.source_type:
-            case "base64":
-                return {
-                    "type": "file",
-                    "file": {
-                        "filename": "file.pdf",
-                        "file_data": f"data:application/{block.media.extension};base64,{block.media.source}",
-                    },
-                }
-            case "path":
-                with open(block.media.source, "rb") as f:
-                    base64_pdf = base64.b64encode(f.read()).decode("utf-8")
-                return {
-                    "type": "file",
-                    "file": {
-                        "filename": "file.pdf",
-                        "file_data": f"data:application/{block.media.extension};base64,{base64_pdf}",
-                    },
-                }
-
-            case _:
-                raise NotImplementedError(
-                    f"Unsupported media source type: {block.media.source_type}"
-                )
+        source_type = block.media.source_type
+        handler = _PDF_HANDLERS.get(source_type)
+        if handler is None:
+            raise NotImplementedError(f"Unsupported media source type: {source_type}")
+        return handler(block)
 
     def _process_image_block(self, block: MediaBlock) -> dict:
-        match block.media.source_type:
-            case "url":
-                return {
-                    "type": "image_url",
-                    "image_url": {"url": block.media.source},
-                }
-
-            case "base64":
-                return {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:image/{block.media.extension};base64,{block.media.source}"
-                    },
-                }
-
-            case "path":
-                with open(block.media.source, "rb") as image_file:
-                    base64_image = base64.b64encode(image_file.read()).decode("utf-8")
-                    return {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:image/{block.media.extension};base64,{base64_image}"
-                        },
-                    }
-
-            case _:
-                raise ValueError(
-                    f"Unsupported media source type: {block.media.source_type}"
-                )
+        source_type = block.media.source_type
+        handler = IMAGE_HANDLERS.get(source_type)
+        if handler is None:
+            raise ValueError(f"Unsupported media source type: {source_type}")
+        return handler(block)
+
+    # Dispatch tables are looked up by exact type, one dict hit per block
+    _BLOCK_HANDLERS: ClassVar[dict[type, Callable]] = {
+        TextBlock: _handle_text_block,
+        StructuredBlock: _handle_structured_block,
+        FunctionCallBlock: _handle_function_call_block,
+        FunctionCallResultBlock: _handle_function_call_result_block,
+        MediaBlock: _handle_media_block,
+    }
+    _MEDIA_HANDLERS: ClassVar[dict[str, Callable]] = {
+        "image": _process_image_block,
+        "pdf": _process_pdf_block,
+        "audio": _process_audio_block,
+    }
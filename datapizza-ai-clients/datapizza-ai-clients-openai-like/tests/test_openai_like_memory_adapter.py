@@ -0,0 +1,187 @@
+import base64
+import json
+import os
+
+from datapizza.memory.memory import Memory
+from datapizza.tools import tool
+from datapizza.type import (
+    ROLE,
+    FunctionCallBlock,
+    FunctionCallResultBlock,
+    Media,
+    MediaBlock,
+    TextBlock,
+)
+
+from datapizza.clients.openai_like.memory_adapter import OpenAILikeMemoryAdapter
+
+
+def _image_memory(path) -> Memory:
+    memory = Memory()
+    memory.new_turn(role=ROLE.USER)
+    memory.add_to_last_turn(
+        MediaBlock(
+            media=Media(
+                media_type="image",
+                source_type="path",
+                source=str(path),
+                extension="png",
+            )
+        )
+    )
+    return memory
+
+
+def test_image_path_is_encoded_as_data_url(tmp_path):
+    image = tmp_path / "image.png"
+    image.write_bytes(b"first")
+
+    messages = OpenAILikeMemoryAdapter().memory_to_messages(_image_memory(image))
+
+    assert messages == [
+        {
+            "role": "user",
+            "content": [
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": "data:image/png;base64,"
+                        + base64.b64encode(b"first").decode("ascii")
+                    },
+                }
+            ],
+        }
+    ]
+
+
+def test_image_path_is_reencoded_when_file_changes(tmp_path):
+    image = tmp_path / "image.png"
+    image.write_bytes(b"first")
+    adapter = OpenAILikeMemoryAdapter()
+    adapter.memory_to_messages(_image_memory(image))
+
+    image.write_bytes(b"second!")
+    os.utime(image, ns=(0, 0))
+
+    messages = adapter.memory_to_messages(_image_memory(image))
+    url = messages[0]["content"][0]["image_url"]["url"]
+    assert url.endswith(base64.b64encode(b"second!").decode("ascii"))
+
+
+@tool
+def get_weather(city: str) -> str:
+    return f"Sunny in {city}"
+
+
+def test_function_call_arguments_are_serialized_once():
+    block = FunctionCallBlock(
+        id="call_1",
+        arguments={"city": "Rome"},
+        name="get_weather",
+        tool=get_weather,
+    )
+    memory = Memory()
+    memory.new_turn(role=ROLE.ASSISTANT)
+    memory.add_to_last_turn(block)
+    adapter = OpenAILikeMemoryAdapter()
+
+    first = adapter.memory_to_messages(memory)
+    second = adapter.memory_to_messages(memory)
+
+    tool_call = first[0]["tool_calls"][0]
+    assert tool_call["function"]["name"] == "get_weather"
+    assert json.loads(tool_call["function"]["arguments"]) == {"city": "Rome"}
+    assert (
+        second[0]["tool_calls"][0]["function"]["arguments"]
+        is tool_call["function"]["arguments"]
+    )
+
+
+def test_function_call_arguments_fall_back_to_stdlib_json():
+    block = FunctionCallBlock(
+        id="call_1",
+        arguments={1: "non-str keys are rejected by orjson"},
+        name="get_weather",
+        tool=get_weather,
+    )
+    memory = Memory()
+    memory.new_turn(role=ROLE.ASSISTANT)
+    memory.add_to_last_turn(block)
+
+    messages = OpenAILikeMemoryAdapter().memory_to_messages(memory)
+
+    arguments = messages[0]["tool_calls"][0]["function"]["arguments"]
+    assert json.loads(arguments) == {"1": "non-str keys are rejected by orjson"}
+
+
+def test_function_call_result_is_a_tool_message():
+    memory = Memory()
+    memory.new_turn(role=ROLE.TOOL)
+    memory.add_to_last_turn(
+        FunctionCallResultBlock(id="call_1", tool=get_weather, result="Sunny in Rome")
+    )
+
+    messages = OpenAILikeMemoryAdapter().memory_to_messages(memory)
+
+    assert messages == [
+        {"role": "tool", "tool_call_id": "call_1", "content": "Sunny in Rome"}
+    ]
+
+
+def test_equal_but_differently_typed_arguments_are_not_shared():
+    memory = Memory()
+    memory.new_turn(role=ROLE.ASSISTANT)
+    memory.add_to_last_turn(
+        FunctionCallBlock(id="a", arguments={"x": 1}, name="f", tool=get_weather)
+    )
+    memory.add_to_last_turn(
+        FunctionCallBlock(id="b", arguments={"x": True}, name="f", tool=get_weather)
+    )
+
+    messages = OpenAILikeMemoryAdapter().memory_to_messages(memory)
+
+    assert [
+        json.loads(m["tool_calls"][0]["function"]["arguments"]) for m in messages
+    ] == [
+        {"x": 1},
+        {"x": True},
+    ]
+    assert messages[1]["tool_calls"][0]["function"]["arguments"] == '{"x":true}'
+
+
+def test_empty_function_call_result_is_sent_as_empty_string():
+    memory = Memory()
+    memory.new_turn(role=ROLE.TOOL)
+    memory.add_to_last_turn(
+        FunctionCallResultBlock(id="call_1", tool=get_weather, result=None)  # type: ignore[arg-type]
+    )
+
+    messages = OpenAILikeMemoryAdapter().memory_to_messages(memory)
+
+    assert messages == [{"role": "tool", "tool_call_id": "call_1", "content": ""}]
+
+
+def test_falsy_function_call_result_is_kept():
+    memory = Memory()
+    memory.new_turn(role=ROLE.TOOL)
+    memory.add_to_last_turn(
+        FunctionCallResultBlock(id="call_1", tool=get_weather, result=0)  # type: ignore[arg-type]
+    )
+
+    messages = OpenAILikeMemoryAdapter().memory_to_messages(memory)
+
+    assert messages == [{"role": "tool", "tool_call_id": "call_1", "content": "0"}]
+
+
+def test_block_subclasses_are_handled_like_their_parent():
+    class NoteBlock(TextBlock):
+        pass
+
+    memory = Memory()
+    memory.new_turn(role=ROLE.USER)
+    memory.add_to_last_turn(NoteBlock(content="Hello"))
+    memory.add_to_last_turn(TextBlock(content=" world"))
+
+    messages = OpenAILikeMemoryAdapter().memory_to_messages(memory)
+
+    assert messages == [{"role": "user", "content": "Hello world"}]
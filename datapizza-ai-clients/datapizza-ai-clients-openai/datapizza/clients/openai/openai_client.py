@@ -1,3 +1,4 @@
+import functools
 import json
 from collections.abc import AsyncIterator, Iterator
 from typing import Literal
@@ -19,6 +20,7 @@ from datapizza.type import (
 from openai import (
     AsyncOpenAI,
     AzureOpenAI,
+    DefaultHttpxClient,
     OpenAI,
 )
 from openai.types.responses import (
@@ -33,6 +35,29 @@ from openai.types.responses import (
 from .memory_adapter import OpenAIMemoryAdapter
 
 
+class _SharedHttpxClient(DefaultHttpxClient):
+    """Process-wide pool that the OpenAI clients using it cannot close.
+
+    OpenAI.close(), and leaving a `with OpenAI(...)` block, close the SDK's
+    http client; for a shared pool that would break every other OpenAIClient,
+    so close() is a no-op and the connections live until the process exits.
+    """
+
+    def close(self) -> None:
+        pass
+
+
+@functools.cache
+def _shared_http_client() -> httpx.Client:
+    """Pooled httpx client reused by every OpenAIClient built without one.
+
+    Sharing the pool keeps TCP/TLS connections alive across client instances.
+    It keeps the SDK's default limits. Only the sync client is shared: async
+    pools are bound to an event loop.
+    """
+    return _SharedHttpxClient()
+
+
 class OpenAIClient(Client):
     """A client for interacting with the OpenAI API.
 
@@ -74,7 +99,7 @@ class OpenAIClient(Client):
             max_retries: The max retries for the OpenAI API.
             default_headers: The default headers for the OpenAI API.
             default_query: The default query for the OpenAI API.
-            http_client: The http_client for the OpenAI API.
+            http_client: The http_client for the OpenAI API. Defaults to a pooled client shared by all OpenAIClient instances.
         """
 
         if temperature and not 0 <= temperature <= 2:
@@ -115,7 +140,9 @@ class OpenAIClient(Client):
                 max_retries=self.max_retries,
                 default_headers=self.default_headers,
                 default_query=self.default_query,
-                http_client=self.http_client,
+                http_client=self.http_client
+                if self.http_client is not None
+                else _shared_http_client(),
             )
 
     def _set_a_client(self):
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 import httpx
 from datapizza.core.clients import ClientResponse
@@ -6,6 +6,7 @@ from datapizza.core.clients import ClientResponse
 from datapizza.clients.openai import (
     OpenAIClient,
 )
+from datapizza.clients.openai.openai_client import _shared_http_client
 
 
 def test_client_init():
@@ -16,7 +17,7 @@ def test_client_init():
     assert client is not None
 
 
-@patch("datapizza.clients.openai.openai_client.OpenAI")
+@patch("datapizza.clients.openai.openai_client.OpenAI", new_callable=Mock)
 def test_client_init_with_extra_args(mock_openai):
     """Tests that extra arguments are passed to the OpenAI client."""
     OpenAIClient(
@@ -37,11 +38,11 @@ def test_client_init_with_extra_args(mock_openai):
         max_retries=3,
         default_headers=None,
         default_query=None,
-        http_client=None,
+        http_client=_shared_http_client(),
     )
 
 
-@patch("datapizza.clients.openai.openai_client.OpenAI")
+@patch("datapizza.clients.openai.openai_client.OpenAI", new_callable=Mock)
 def test_client_init_with_http_client(mock_openai):
     """Tests that a custom http_client is passed to the OpenAI client."""
     custom_http_client = httpx.Client()
@@ -64,19 +65,17 @@ def test_client_init_with_http_client(mock_openai):
     )
 
 
-@patch("datapizza.clients.openai.openai_client.OpenAI")
+@patch("datapizza.clients.openai.openai_client.OpenAI", new_callable=Mock)
 def test_invoke_kwargs_override(mock_openai_class):
     """
     Tests that kwargs like 'stream' are not overridden by user input
     in non-streaming methods, but other kwargs are passed through.
     """
     mock_openai_instance = mock_openai_class.return_value
-    mock_openai_instance.responses.create.return_value = MagicMock()
+    mock_openai_instance.responses.create.return_value = Mock()
 
     client = OpenAIClient(api_key="test")
-    client._response_to_client_response = MagicMock(
-        return_value=ClientResponse(content=[])
-    )
+    client._response_to_client_response = Mock(return_value=ClientResponse(content=[]))
 
     client.invoke("hello", stream=True, top_p=0.5)
 
@@ -87,7 +86,7 @@ def test_invoke_kwargs_override(mock_openai_class):
     assert called_kwargs.get("stream") is False
 
 
-@patch("datapizza.clients.openai.openai_client.OpenAI")
+@patch("datapizza.clients.openai.openai_client.OpenAI", new_callable=Mock)
 def test_stream_invoke_kwargs_override(mock_openai_class):
     """
     Tests that kwargs like 'stream' are not overridden by user input
@@ -105,3 +104,20 @@ def test_stream_invoke_kwargs_override(mock_openai_class):
 
     assert called_kwargs.get("top_p") == 0.5
     assert called_kwargs.get("stream") is True
+
+
+def test_clients_share_default_http_client():
+    first = OpenAIClient(api_key="test_api_key")
+    second = OpenAIClient(api_key="other_api_key")
+
+    assert first.client._client is second.client._client
+
+
+def test_closing_one_client_keeps_the_shared_pool_open():
+    first = OpenAIClient(api_key="test_api_key")
+    second = OpenAIClient(api_key="other_api_key")
+
+    with first.client:
+        pass
+
+    assert not second.client.is_closed()
@@ -1,8 +1,15 @@
-import base64
-import json
 import logging
-from typing import Any
-
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+from datapizza.memory.chat_format import (
+    AUDIO_HANDLERS,
+    IMAGE_HANDLERS,
+    application_url_prefix,
+    encode_path,
+    handler_for,
+    tool_call,
+)
 from datapizza.memory.memory import Turn
 from datapizza.memory.memory_adapter import MemoryAdapter
 from datapizza.type import (
@@ -17,159 +24,131 @@ from datapizza.type import (
 log = logging.getLogger(__name__)
 
 
+def _pdf_from_base64(block: MediaBlock) -> dict:
+    media = block.media
+    return {
+        "type": "input_file",
+        "filename": "file.pdf",
+        "file_data": application_url_prefix(media.extension) + media.source,
+    }
+
+
+def _pdf_from_path(block: MediaBlock) -> dict:
+    media = block.media
+    return {
+        "type": "input_file",
+        "filename": "file.pdf",
+        "file_data": encode_path(media.source, application_url_prefix(media.extension)),
+    }
+
+
+_PDF_HANDLERS: dict[str, Callable[[MediaBlock], dict]] = {
+    "base64": _pdf_from_base64,
+    "path": _pdf_from_path,
+}
+
+
 class WatsonXMemoryAdapter(MemoryAdapter):
     def _turn_to_message(self, turn: Turn) -> dict:
+        blocks = turn.blocks
+        if len(blocks) == 1 and type(blocks[0]) is TextBlock:
+            # Single-text turns are the common case and need no block loop
+            return {"role": turn.role.value, "content": blocks[0].content}
+
         content: list[dict[str, Any]] = []
         tool_calls: list[dict[str, Any]] = []
 
-        for block in turn:
-            match block:
-                case TextBlock():
-                    content.append({"type": "text", "text": block.content})
-
-                case FunctionCallBlock():
-                    tool_calls.append(
-                        {
-                            "id": block.id,
-                            "type": "function",
-                            "function": {
-                                "name": block.name,
-                                "arguments": json.dumps(block.arguments),
-                            },
-                        }
-                    )
-
-                case FunctionCallResultBlock():
-                    # Tool output is a separate message type usually
-                    return {
-                        "role": "tool",
-                        "tool_call_id": block.id,
-                        "content": str(block.result),
-                    }
-
-                case StructuredBlock():
-                    content.append({"type": "text", "text": str(block.content)})
-
-                case MediaBlock():
-                    match block.media.media_type:
-                        case "image":
-                            content.append(self._process_image_block(block))
-                        case "pdf":
-                            content.append(self._process_pdf_block(block))
-                        case "audio":
-                            content.append(self._process_audio_block(block))
-                        case _:
-                            log.warning(
-                                f"Unsupported media type: {block.media.media_type}"
-                            )
-
-        message: dict[str, Any] = {
-            "role": turn.role.value,
-        }
+        for block in blocks:
+            handler = handler_for(self._BLOCK_HANDLERS, type(block))
+            if handler is None:
+                continue
+            tool_message = handler(self, block, content, tool_calls)
+            if tool_message is not None:
+                return tool_message
 
+        # Each shape is one literal instead of a dict filled in key by key
+        role = turn.role.value
         if tool_calls:
-            message["tool_calls"] = tool_calls
-            if content:
-                message["content"] = content
-            else:
-                message["content"] = ""
-        else:
+            return {"role": role, "tool_calls": tool_calls, "content": content or ""}
+        if len(content) == 1 and content[0]["type"] == "text":
             # Optimization: if single text block, use string content
-            if len(content) == 1 and content[0]["type"] == "text":
-                message["content"] = content[0]["text"]
-            else:
-                message["content"] = content
+            return {"role": role, "content": content[0]["text"]}
+        return {"role": role, "content": content}
+
+    def _handle_text_block(
+        self, block: TextBlock, content: list[dict], tool_calls: list[dict]
+    ) -> None:
+        content.append({"type": "text", "text": block.content})
+
+    def _handle_function_call_block(
+        self, block: FunctionCallBlock, content: list[dict], tool_calls: list[dict]
+    ) -> None:
+        tool_calls.append(tool_call(block))
+
+    def _handle_function_call_result_block(
+        self,
+        block: FunctionCallResultBlock,
+        content: list[dict],
+        tool_calls: list[dict],
+    ) -> dict:
+        # Tool output is a separate message type usually
+        return {
+            "role": "tool",
+            "tool_call_id": block.id,
+            "content": "" if block.result is None else str(block.result),
+        }
 
-        return message
+    def _handle_structured_block(
+        self, block: StructuredBlock, content: list[dict], tool_calls: list[dict]
+    ) -> None:
+        content.append({"type": "text", "text": str(block.content)})
+
+    def _handle_media_block(
+        self, block: MediaBlock, content: list[dict], tool_calls: list[dict]
+    ) -> None:
+        media_type = block.media.media_type
+        process = self._MEDIA_HANDLERS.get(media_type)
+        if process is None:
+            log.warning(f"Unsupported media type: {media_type}")
+            return
+        content.append(process(self, block))
 
     def _text_to_message(self, text: str, role: ROLE) -> dict:
         return {"role": role.value, "content": text}
 
     def _process_audio_block(self, block: MediaBlock) -> dict:
-        match block.media.source_type:
-            case "path":
-                with open(block.media.source, "rb") as f:
-                    base64_audio = base64.b64encode(f.read()).decode("utf-8")
-                return {
-                    "type": "input_audio",
-                    "input_audio": {
-                        "data": base64_audio,
-                        "format": block.media.extension,
-                    },
-                }
-
-            case "base_64":
-                return {
-                    "type": "input_audio",
-                    "input_audio": {
-                        "data": block.media.source,
-                        "format": block.media.extension,
-                    },
-                }
-            case "raw":
-                base64_audio = base64.b64encode(block.media.source).decode("utf-8")
-                return {
-                    "type": "input_audio",
-                    "input_audio": {
-                        "data": base64_audio,
-                        "format": block.media.extension,
-                    },
-                }
-
-            case _:
-                raise NotImplementedError(
-                    f"Unsupported media source type: {block.media.source_type} for audio"
-                )
+        source_type = block.media.source_type
+        handler = AUDIO_HANDLERS.get(source_type)
+        if handler is None:
+            raise NotImplementedError(
+                f"Unsupported media source type: {source_type} for audio"
+            )
+        return handler(block)
 
     def _process_pdf_block(self, block: MediaBlock) -> dict:
-        match block.media.source_type:
-            case "base64":
-                return {
-                    "type": "input_file",
-                    "filename": "file.pdf",
-                    "file_data": f"data:application/{block.media.extension};base64,{block.media.source}",
-                }
-            case "path":
-                with open(block.media.source, "rb") as f:
-                    base64_pdf = base64.b64encode(f.read()).decode("utf-8")
-                return {
-                    "type": "input_file",
-                    "filename": "file.pdf",
-                    "file_data": f"data:application/{block.media.extension};base64,{base64_pdf}",
-                }
-
-            case _:
-                raise NotImplementedError(
-                    f"Unsupported media source type: {block.media.source_type}"
-                )
+        source_type = block.media.source_type
+        handler = _PDF_HANDLERS.get(source_type)
+        if handler is None:
+            raise NotImplementedError(f"Unsupported media source type: {source_type}")
+        return handler(block)
 
     def _process_image_block(self, block: MediaBlock) -> dict:
-        match block.media.source_type:
-            case "url":
-                return {
-                    "type": "image_url",
-                    "image_url": {"url": block.media.source},
-                }
-
-            case "base64":
-                return {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:image/{block.media.extension};base64,{block.media.source}"
-                    },
-                }
-
-            case "path":
-                with open(block.media.source, "rb") as image_file:
-                    base64_image = base64.b64encode(image_file.read()).decode("utf-8")
-                    return {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:image/{block.media.extension};base64,{base64_image}"
-                        },
-                    }
-
-            case _:
-                raise ValueError(
-                    f"Unsupported media source type: {block.media.source_type}"
-                )
+        source_type = block.media.source_type
+        handler = IMAGE_HANDLERS.get(source_type)
+        if handler is None:
+            raise ValueError(f"Unsupported media source type: {source_type}")
+        return handler(block)
+
+    # Dispatch tables are looked up by exact type, one dict hit per block
+    _BLOCK_HANDLERS: ClassVar[dict[type, Callable]] = {
+        TextBlock: _handle_text_block,
+        FunctionCallBlock: _handle_function_call_block,
+        FunctionCallResultBlock: _handle_function_call_result_block,
+        StructuredBlock: _handle_structured_block,
+        MediaBlock: _handle_media_block,
+    }
+    _MEDIA_HANDLERS: ClassVar[dict[str, Callable]] = {
+        "image": _process_image_block,
+        "pdf": _process_pdf_block,
+        "audio": _process_audio_block,
+    }
@@ -1,27 +1,74 @@
+import asyncio
+import functools
 import json
 import logging
+import weakref
 from collections.abc import AsyncIterator, Iterator
 from typing import Any, Literal
 
-try:
-    from ibm_watsonx_ai import APIClient, Credentials
-    from ibm_watsonx_ai.foundation_models import ModelInference
-except ImportError:
-    raise ImportError(
-        "ibm-watsonx-ai is not installed. Please install it with `pip install ibm-watsonx-ai`"
-    ) from None
-
 from datapizza.core.cache import Cache
 from datapizza.core.clients import Client, ClientResponse
 from datapizza.core.clients.models import TokenUsage
+from datapizza.core.executors.async_executor import AsyncExecutor
 from datapizza.memory import Memory
 from datapizza.tools import Tool
 from datapizza.type import Block, FunctionCallBlock, Model, TextBlock
 
 from .memory_adapter import WatsonXMemoryAdapter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 log = logging.getLogger(__name__)
 
+# orjson is an optional speedup; its decode error subclasses json.JSONDecodeError
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Above this many characters of tool-call arguments, _a_invoke parses the
+# response in a worker thread instead of on the event loop
+_OFFLOAD_ARGUMENTS_SIZE = 256 * 1024
+
+
+def _tool_arguments_size(response: dict) -> int:
+    choices = response.get("choices")
+    if not choices:
+        return 0
+    tool_calls = choices[0].get("message", {}).get("tool_calls") or ()
+    return sum(
+        len(arguments)
+        for tool_call in tool_calls
+        if isinstance(arguments := tool_call.get("function", {}).get("arguments"), str)
+    )
+
+
+@functools.cache
+def _watsonx_sdk() -> tuple[type, type, type]:
+    """Import the WatsonX SDK on first use; it is slow to import (pandas, numpy)."""
+    try:
+        from ibm_watsonx_ai import APIClient, Credentials
+        from ibm_watsonx_ai.foundation_models import ModelInference
+    except ImportError:
+        raise ImportError(
+            "ibm-watsonx-ai is not installed. Please install it with `pip install ibm-watsonx-ai`"
+        ) from None
+    return APIClient, Credentials, ModelInference
+
+
+@functools.lru_cache(maxsize=16)
+def _shared_api_client(url: str, api_key: str, project_id: str) -> Any:
+    """APIClient reused by every WatsonXClient with the same credentials.
+
+    The APIClient owns the authenticated session and its httpx connection
+    pools, so sharing it keeps connections and the IAM token alive across
+    client instances instead of re-authenticating for each one.
+    """
+    APIClient, Credentials, _ = _watsonx_sdk()
+    credentials = Credentials(url=url, api_key=api_key)
+    return APIClient(credentials, project_id=project_id)
+
 
 class WatsonXClient(Client):
     """
@@ -59,12 +106,17 @@ class WatsonXClient(Client):
         self.project_id = project_id
 
         self.memory_adapter = WatsonXMemoryAdapter()
+        # tool -> (fingerprint, schema); tools are reused across invocations, and
+        # weak keys drop an entry once its Tool is garbage-collected
+        self._tool_schema_cache: weakref.WeakKeyDictionary[Tool, tuple] = (
+            weakref.WeakKeyDictionary()
+        )
         self._set_client()
 
     def _set_client(self):
         if not self.client:
-            credentials = Credentials(url=self.url, api_key=self.api_key)
-            api_client = APIClient(credentials, project_id=self.project_id)
+            _, _, ModelInference = _watsonx_sdk()
+            api_client = _shared_api_client(self.url, self.api_key, self.project_id)
             self.client = ModelInference(
                 model_id=self.model_name, api_client=api_client
             )
@@ -75,26 +127,45 @@ class WatsonXClient(Client):
         pass
 
     def _convert_tools(self, tool: Tool) -> dict:
-        return {
+        properties = tool.properties
+        # Cheap guard against a Tool mutated since it was cached
+        fingerprint = (
+            tool.name,
+            tool.description,
+            id(properties),
+            len(properties) if properties else 0,
+            tuple(tool.required),
+        )
+        cached = self._tool_schema_cache.get(tool)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        schema = {
             "type": "function",
             "function": {
                 "name": tool.name,
                 "description": tool.description,
                 "parameters": {
                     "type": "object",
-                    "properties": tool.properties,
+                    "properties": properties,
                     "required": tool.required,
                 },
             },
         }
+        self._tool_schema_cache[tool] = (fingerprint, schema)
+        return schema
 
     def _convert_tool_choice(
         self, tool_choice: Literal["auto", "required", "none"] | list[str]
     ) -> dict | str:
+        if type(tool_choice) is str:
+            # "auto", "required" and "none" are passed through as-is
+            return tool_choice
         if isinstance(tool_choice, list):
             if len(tool_choice) > 1:
                 raise NotImplementedError("multiple function names is not supported")
             if tool_choice:
+                # A fresh dict per request, the SDK may hold on to or mutate it
                 return {"type": "function", "function": {"name": tool_choice[0]}}
             return "none"
         return tool_choice
@@ -118,33 +189,7 @@ class WatsonXClient(Client):
 
             tool_calls = message.get("tool_calls")
             if tool_calls:
-                for tool_call in tool_calls:
-                    if tool_call.get("type") == "function":
-                        function = tool_call.get("function", {})
-                        name = function.get("name")
-
-                        arguments: dict[str, Any] = {}
-                        raw_args = function.get("arguments")
-
-                        if isinstance(raw_args, str):
-                            try:
-                                arguments = json.loads(raw_args)
-                            except json.JSONDecodeError:
-                                log.warning(
-                                    f"Failed to parse arguments for tool {name}: {raw_args}"
-                                )
-                        elif isinstance(raw_args, dict):
-                            arguments = raw_args
-
-                        if tool_map and name in tool_map:
-                            content_blocks.append(
-                                FunctionCallBlock(
-                                    id=tool_call.get("id"),
-                                    name=name,
-                                    arguments=arguments,
-                                    tool=tool_map[name],
-                                )
-                            )
+                content_blocks.extend(self._parse_tool_calls(tool_calls, tool_map))
 
         if "usage" in response:
             resp_usage = response["usage"]
@@ -158,6 +203,48 @@ class WatsonXClient(Client):
             content=content_blocks, stop_reason=stop_reason, usage=usage
         )
 
+    def _parse_tool_calls(
+        self, tool_calls: list[dict], tool_map: dict[str, Tool] | None
+    ) -> list[Block]:
+        """Convert WatsonX tool calls into FunctionCallBlocks for known tools."""
+        blocks: list[Block] = []
+        if not tool_map:
+            return blocks
+        append = blocks.append
+
+        for tool_call in tool_calls:
+            if tool_call.get("type") != "function":
+                continue
+            function = tool_call.get("function", {})
+            name = function.get("name")
+            tool = tool_map.get(name)
+            if tool is None:
+                # Calls to unknown tools are dropped, so skip decoding them
+                continue
+
+            arguments: dict[str, Any] = {}
+            raw_args = function.get("arguments")
+
+            if isinstance(raw_args, str):
+                try:
+                    arguments = _loads(raw_args)
+                except json.JSONDecodeError:
+                    log.warning(
+                        f"Failed to parse arguments for tool {name}: {raw_args}"
+                    )
+            elif isinstance(raw_args, dict):
+                arguments = raw_args
+
+            append(
+                FunctionCallBlock(
+                    id=tool_call.get("id"),
+                    name=name,
+                    arguments=arguments,
+                    tool=tool,
+                )
+            )
+        return blocks
+
     def _invoke(
         self,
         input: list[Block],
@@ -186,7 +273,7 @@ class WatsonXClient(Client):
 
         chat_kwargs = {}
         if tools:
-            chat_kwargs["tools"] = [self._convert_tools(tool) for tool in tools]
+            chat_kwargs["tools"] = list(map(self._convert_tools, tools))
             chat_kwargs["tool_choice"] = self._convert_tool_choice(tool_choice)  # type: ignore
 
         # Invoke
@@ -223,7 +310,7 @@ class WatsonXClient(Client):
 
         chat_kwargs = {}
         if tools:
-            chat_kwargs["tools"] = [self._convert_tools(tool) for tool in tools]
+            chat_kwargs["tools"] = list(map(self._convert_tools, tools))
             chat_kwargs["tool_choice"] = self._convert_tool_choice(tool_choice)  # type: ignore
 
         # Invoke Async
@@ -231,8 +318,77 @@ class WatsonXClient(Client):
             messages=messages, params=params if params else None, **chat_kwargs
         )
 
+        if _tool_arguments_size(response) > _OFFLOAD_ARGUMENTS_SIZE:
+            # Decoding large tool arguments would stall the event loop
+            return await asyncio.to_thread(self._parse_response, response, tool_map)
         return self._parse_response(response, tool_map)
 
+    async def a_batch_invoke(
+        self,
+        inputs: list[str | list[Block]],
+        max_concurrency: int = 50,
+        requests_per_minute: int | None = None,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> list[ClientResponse | BaseException]:
+        """
+        Run many independent inference requests concurrently.
+
+        Args:
+            inputs: The inputs to send, one request per item.
+            max_concurrency: Maximum number of requests in flight at once.
+            requests_per_minute: Optional cap on how fast requests are started.
+            return_exceptions: If True, a failed request yields its exception in
+                place of a response instead of failing the whole batch.
+            **kwargs: Additional keyword arguments passed to `a_invoke`.
+
+        Returns:
+            The responses, in the same order as `inputs`.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        interval = 60 / requests_per_minute if requests_per_minute else 0.0
+        pacing = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        next_start = loop.time()
+
+        async def run(input: str | list[Block]) -> ClientResponse:
+            nonlocal next_start
+            async with semaphore:
+                if interval:
+                    async with pacing:
+                        delay = next_start - loop.time()
+                        next_start = max(next_start, loop.time()) + interval
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                return await self.a_invoke(input, **kwargs)
+
+        return await asyncio.gather(
+            *(run(input) for input in inputs), return_exceptions=return_exceptions
+        )
+
+    def batch_invoke(
+        self,
+        inputs: list[str | list[Block]],
+        max_concurrency: int = 50,
+        requests_per_minute: int | None = None,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> list[ClientResponse | BaseException]:
+        """
+        Run many independent inference requests concurrently, from sync code.
+
+        See `a_batch_invoke` for the arguments.
+        """
+        return AsyncExecutor.get_instance().run(
+            self.a_batch_invoke(
+                inputs,
+                max_concurrency=max_concurrency,
+                requests_per_minute=requests_per_minute,
+                return_exceptions=return_exceptions,
+                **kwargs,
+            )
+        )
+
     def _stream_invoke(
         self,
         input: list[Block],
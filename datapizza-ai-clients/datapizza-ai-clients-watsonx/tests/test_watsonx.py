@@ -1,2 +1,136 @@
+import asyncio
+import gc
+import sys
+from unittest.mock import patch
+
+from datapizza.clients.watsonx import WatsonXClient
+from datapizza.clients.watsonx.memory_adapter import WatsonXMemoryAdapter
+from datapizza.core.clients import ClientResponse
+from datapizza.memory.memory import Memory
+from datapizza.tools import Tool, tool
+from datapizza.type import ROLE, FunctionCallResultBlock, TextBlock
+
+
+@tool
+def count_items() -> int:
+    return 0
+
+
+def _client() -> WatsonXClient:
+    # Skip building the SDK client, the tests below never reach the API
+    with patch.object(WatsonXClient, "_set_client"):
+        return WatsonXClient(
+            api_key="test-key", url="https://example.com", project_id="p"
+        )
+
+
 def test_init():
     assert 1 == 1
+
+
+def test_import_does_not_load_sdk():
+    from datapizza.clients.watsonx import WatsonXClient
+
+    assert WatsonXClient is not None
+    assert "ibm_watsonx_ai" not in sys.modules
+
+
+def test_falsy_function_call_result_is_kept():
+    memory = Memory()
+    memory.new_turn(role=ROLE.TOOL)
+    memory.add_to_last_turn(
+        FunctionCallResultBlock(id="call_1", tool=count_items, result=0)  # type: ignore[arg-type]
+    )
+
+    messages = WatsonXMemoryAdapter().memory_to_messages(memory)
+
+    assert messages == [{"role": "tool", "tool_call_id": "call_1", "content": "0"}]
+
+
+def test_tool_schema_is_cached_per_tool():
+    client = _client()
+
+    schema = client._convert_tools(count_items)
+
+    assert client._convert_tools(count_items) is schema
+    assert schema["function"]["name"] == "count_items"
+
+
+def test_tool_schema_cache_follows_tool_changes():
+    client = _client()
+    edited = Tool(func=count_items.func, description="Count the items")
+    client._convert_tools(edited)
+
+    edited.description = "Count every item"
+
+    schema = client._convert_tools(edited)
+    assert schema["function"]["description"] == "Count every item"
+
+
+def test_tool_schema_cache_drops_collected_tools():
+    client = _client()
+    transient = Tool(func=count_items.func, name="transient")
+    client._convert_tools(transient)
+    assert len(client._tool_schema_cache) == 1
+
+    del transient
+    gc.collect()
+
+    assert len(client._tool_schema_cache) == 0
+
+
+class _FakeInvoke:
+    """Stands in for `a_invoke`, recording start times and requests in flight."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.starts: list[float] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, input, **kwargs) -> ClientResponse:
+        self.starts.append(asyncio.get_running_loop().time())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Later inputs finish first, so ordering cannot come from completion
+            await asyncio.sleep(self.delay / (int(input) + 1))
+            return ClientResponse(content=[TextBlock(content=input)])
+        finally:
+            self.in_flight -= 1
+
+
+def test_batch_invoke_keeps_input_order():
+    client = _client()
+    fake = _FakeInvoke(delay=0.05)
+    inputs = [str(i) for i in range(5)]
+
+    with patch.object(client, "a_invoke", fake):
+        responses = client.batch_invoke(inputs)
+
+    assert [response.text for response in responses] == inputs
+
+
+def test_batch_invoke_caps_concurrency():
+    client = _client()
+    fake = _FakeInvoke(delay=0.02)
+
+    with patch.object(client, "a_invoke", fake):
+        client.batch_invoke([str(i) for i in range(8)], max_concurrency=3)
+
+    assert len(fake.starts) == 8
+    assert fake.max_in_flight == 3
+
+
+def test_batch_invoke_paces_request_starts():
+    client = _client()
+    fake = _FakeInvoke()
+
+    with patch.object(client, "a_invoke", fake):
+        client.batch_invoke([str(i) for i in range(4)], requests_per_minute=1200)
+
+    # 1200 requests per minute is one start every 50ms
+    starts = fake.starts
+    gaps = [starts[i + 1] - starts[i] for i in range(len(starts) - 1)]
+    assert len(gaps) == 3
+    assert all(gap >= 0.045 for gap in gaps)
@@ -1,9 +1,12 @@
+import asyncio
 import base64
+import importlib
 import io
 import logging
 import os
 import sys
-from typing import Any
+from collections.abc import Awaitable, Iterable
+from typing import Any, TypeVar
 
 from typing_extensions import override
 
@@ -14,11 +17,62 @@ from datapizza.core.clients.models import TokenUsage
 
 SENSITIVE_HEADERS = {"api-key", "authorization"}
 
+T = TypeVar("T")
+
 
 def is_dict(obj: object) -> bool:
     return isinstance(obj, dict)
 
 
+def import_attribute(module_path: str, name: str) -> Any:
+    """Resolve `name` from the module at `module_path`.
+
+    The import itself is cached in sys.modules; the attribute is looked up on
+    every call so that patched or reloaded modules are picked up.
+    Raises ImportError or AttributeError like importlib.import_module/getattr.
+    """
+    return getattr(importlib.import_module(module_path), name)
+
+
+def load_yaml(stream: Any) -> Any:
+    """Parse YAML like yaml.safe_load, with libyaml's C loader when available."""
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+async def gather_bounded(
+    awaitables: Iterable[Awaitable[T]], limit: int | None = None
+) -> list[T]:
+    """Await all `awaitables` concurrently and return their results in order.
+
+    At most `limit` run at once (no bound if None). If one raises, the others
+    are cancelled before the exception propagates, instead of running on.
+    """
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def run(awaitable: Awaitable[T]) -> T:
+        try:
+            if semaphore is None:
+                return await awaitable
+            async with semaphore:
+                return await awaitable
+        except BaseException:
+            # Never started if cancelled while waiting for the semaphore
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise
+
+    tasks = [asyncio.ensure_future(run(awaitable)) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 def _basic_config(logger: logging.Logger) -> None:
     # Color codes for different log levels
     COLORS = {
@@ -1,9 +1,14 @@
+import hashlib
 import logging
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
+from datapizza.core.cache import Cache
 from datapizza.core.clients import Client
 from datapizza.core.embedder import BaseEmbedder
 from datapizza.core.models import PipelineComponent
+from datapizza.core.utils import gather_bounded
 from datapizza.type import Chunk, DenseEmbedding, SparseEmbedding
 
 log = logging.getLogger(__name__)
@@ -38,6 +43,9 @@ class ChunkEmbedder(PipelineComponent):
         model_name: str | None = None,
         embedding_name: str | None = None,
         batch_size: int = 2047,
+        cache: Cache | None = None,
+        max_workers: int = 1,
+        max_concurrency: int | None = 4,
     ):
         """
         Initialize the ChunkEmbedder.
@@ -47,17 +55,72 @@ class ChunkEmbedder(PipelineComponent):
             model_name (str, optional): The model name to use for embedding. Defaults to None.
             embedding_name (str, optional): The name of the embedding to use. Defaults to None.
             batch_size (int, optional): The batch size to use for embedding. Defaults to 2047.
+            cache (Cache, optional): Cache for dense vectors keyed by a hash of the chunk text, so re-ingested text is not embedded again. Defaults to None.
+            max_workers (int, optional): The number of threads `embed` sends batches from. The client must be thread-safe to raise it. Defaults to 1.
+            max_concurrency (int, optional): The maximum number of batches `a_embed` has in flight at once, None for no limit. Defaults to 4.
         """
         self.client = client
         self.model_name = model_name
         self.embedding_name = embedding_name
         self.batch_size = batch_size
+        self.cache = cache
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
 
     def _batch_nodes(
-        self, nodes: list[Chunk], batch_size: int
-    ) -> Generator[list[Chunk], None, None]:
-        for i in range(0, len(nodes), batch_size):
-            yield nodes[i : i + batch_size]
+        self, texts: list[str], batch_size: int
+    ) -> Generator[list[str], None, None]:
+        for i in range(0, len(texts), batch_size):
+            yield texts[i : i + batch_size]
+
+    def _cache_key(self, text: str) -> str:
+        model_name = self.model_name or getattr(self.client, "model_name", None)
+        return hashlib.sha256(f"{model_name}|{text}".encode()).hexdigest()
+
+    def _pending_texts(self, nodes: list[Chunk]) -> tuple[dict[str, Any], list[str]]:
+        """Split the distinct chunk texts into cached embeddings and texts to embed."""
+        embeddings: dict[str, Any] = {}
+        pending: list[str] = []
+        for text in dict.fromkeys(n.text for n in nodes):
+            cached = self.cache.get(self._cache_key(text)) if self.cache else None
+            if cached is not None:
+                embeddings[text] = cached
+            else:
+                pending.append(text)
+        return embeddings, pending
+
+    def _store(
+        self, embeddings: dict[str, Any], texts: list[str], results: list[Any]
+    ) -> None:
+        for text, embedding in zip(texts, results, strict=False):
+            embeddings[text] = embedding
+            # Sparse embeddings are not plain data, only dense vectors are cached
+            if self.cache and not isinstance(embedding, SparseEmbedding):
+                try:
+                    self.cache.set(self._cache_key(text), embedding)
+                except Exception as e:
+                    log.error(f"Error setting embedding cache: {e}")
+
+    def _attach(self, nodes: list[Chunk], embeddings: dict[str, Any]) -> list[Chunk]:
+        # Chunks sharing a text get their own copy, so changing one chunk's
+        # embedding (or a cached vector) never leaks into another
+        for n in nodes:
+            embedding = embeddings.get(n.text)
+            if embedding is None:
+                continue
+            if isinstance(embedding, SparseEmbedding):
+                n.embeddings.append(
+                    SparseEmbedding(
+                        name=self.embedding_name,  # type: ignore
+                        values=list(embedding.values),
+                        indices=list(embedding.indices),
+                    )
+                )
+            else:
+                n.embeddings.append(
+                    DenseEmbedding(name=self.embedding_name, vector=list(embedding))  # type: ignore
+                )
+        return nodes
 
     def embed(self, nodes: list[Chunk]) -> list[Chunk]:
         """
@@ -72,19 +135,24 @@ class ChunkEmbedder(PipelineComponent):
         if not all(isinstance(n, Chunk) for n in nodes):
             raise ValueError("Nodes must be of type Chunk")
 
-        for batch in self._batch_nodes(nodes, batch_size=self.batch_size):
-            embeddings = self.client.embed([n.text for n in batch], self.model_name)
-
-            for n, embedding in zip(batch, embeddings, strict=False):
-                if isinstance(embedding, SparseEmbedding):
-                    embedding.name = self.embedding_name
-                    n.embeddings.append(embedding)
-                else:
-                    n.embeddings.append(
-                        DenseEmbedding(name=self.embedding_name, vector=embedding)  # type: ignore
+        # Identical texts are embedded once and cached ones not at all
+        embeddings, pending = self._pending_texts(nodes)
+        batches = list(self._batch_nodes(pending, batch_size=self.batch_size))
+        if len(batches) > 1 and self.max_workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(batches))
+            ) as executor:
+                results = list(
+                    executor.map(
+                        lambda batch: self.client.embed(batch, self.model_name), batches
                     )
+                )
+        else:
+            results = [self.client.embed(batch, self.model_name) for batch in batches]
+        for batch, batch_embeddings in zip(batches, results, strict=True):
+            self._store(embeddings, batch, batch_embeddings)
 
-        return nodes
+        return self._attach(nodes, embeddings)
 
     async def a_embed(self, nodes: list[Chunk]) -> list[Chunk]:
         """
@@ -99,20 +167,17 @@ class ChunkEmbedder(PipelineComponent):
         if not all(isinstance(n, Chunk) for n in nodes):
             raise ValueError("Nodes must be of type Chunk")
 
-        for batch in self._batch_nodes(nodes, batch_size=self.batch_size):
-            embeddings = await self.client.a_embed(
-                [n.text for n in batch], self.model_name
-            )
-
-            for n, embedding in zip(batch, embeddings, strict=False):
-                if isinstance(embedding, SparseEmbedding):
-                    n.embeddings.append(embedding)
-                else:
-                    n.embeddings.append(
-                        DenseEmbedding(name=self.embedding_name, vector=embedding)  # type: ignore
-                    )
-
-        return nodes
+        embeddings, pending = self._pending_texts(nodes)
+        # Batches are independent requests, so send them concurrently
+        batches = list(self._batch_nodes(pending, batch_size=self.batch_size))
+        results = await gather_bounded(
+            (self.client.a_embed(batch, self.model_name) for batch in batches),
+            self.max_concurrency,
+        )
+        for batch, batch_embeddings in zip(batches, results, strict=True):
+            self._store(embeddings, batch, batch_embeddings)
+
+        return self._attach(nodes, embeddings)
 
     def _run(self, nodes: list[Chunk]) -> list[Chunk]:
         return self.embed(nodes)
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+
+from datapizza.core.cache import MemoryCache
+from datapizza.core.embedder import BaseEmbedder
+from datapizza.embedders import ChunkEmbedder
+from datapizza.type import Chunk, SparseEmbedding
+
+
+class FakeEmbedder(BaseEmbedder):
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.embedded: list[str] = []
+
+    def embed(self, text, model_name=None):
+        self.embedded.extend(text)
+        return [[float(len(t))] for t in text]
+
+    async def a_embed(self, text, model_name=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.embed(text)
+
+
+def test_a_embed_sends_batches_concurrently():
+    client = FakeEmbedder()
+    embedder = ChunkEmbedder(client=client, embedding_name="fake", batch_size=2)
+    chunks = [Chunk(id=str(i), text="x" * i) for i in range(5)]
+
+    result = asyncio.run(embedder.a_embed(chunks))
+
+    assert client.max_in_flight == 3
+    assert [c.embeddings[0].vector for c in result] == [[float(i)] for i in range(5)]
+    assert all(c.embeddings[0].name == "fake" for c in result)
+
+
+class BlockingEmbedder(FakeEmbedder):
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+
+    def embed(self, text, model_name=None):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        return [[float(len(t))] for t in text]
+
+
+def test_a_embed_bounds_concurrent_batches():
+    client = FakeEmbedder()
+    embedder = ChunkEmbedder(client=client, batch_size=1, max_concurrency=2)
+
+    asyncio.run(embedder.a_embed([Chunk(id=str(i), text="x" * i) for i in range(5)]))
+
+    assert client.max_in_flight == 2
+
+
+def test_embed_sends_batches_from_a_thread_pool():
+    client = BlockingEmbedder()
+    embedder = ChunkEmbedder(client=client, batch_size=1, max_workers=2)
+    chunks = [Chunk(id=str(i), text="x" * i) for i in range(4)]
+
+    result = embedder.embed(chunks)
+
+    assert client.max_in_flight == 2
+    assert [c.embeddings[0].vector for c in result] == [[float(i)] for i in range(4)]
+
+
+def test_embed_is_serial_by_default():
+    client = BlockingEmbedder()
+    embedder = ChunkEmbedder(client=client, batch_size=1)
+
+    embedder.embed([Chunk(id=str(i), text="x" * i) for i in range(3)])
+
+    assert client.max_in_flight == 1
+
+
+def test_embed_skips_duplicate_and_cached_texts():
+    client = FakeEmbedder()
+    embedder = ChunkEmbedder(client=client, cache=MemoryCache())
+
+    first = [Chunk(id=str(i), text=text) for i, text in enumerate(["a", "bb", "a"])]
+    embedder.embed(first)
+    assert client.embedded == ["a", "bb"]
+    assert [c.embeddings[0].vector for c in first] == [[1.0], [2.0], [1.0]]
+
+    second = [Chunk(id="3", text="bb"), Chunk(id="4", text="ccc")]
+    embedder.embed(second)
+    assert client.embedded == ["a", "bb", "ccc"]
+    assert [c.embeddings[0].vector for c in second] == [[2.0], [3.0]]
+
+
+class SparseFakeEmbedder(FakeEmbedder):
+    def embed(self, text, model_name=None):
+        return [
+            SparseEmbedding(name="raw", values=[1.0], indices=[len(t)]) for t in text
+        ]
+
+
+def test_identical_texts_do_not_share_embeddings():
+    embedder = ChunkEmbedder(client=FakeEmbedder(), cache=MemoryCache())
+    a, b = embedder.embed([Chunk(id="a", text="same"), Chunk(id="b", text="same")])
+    (c,) = embedder.embed([Chunk(id="c", text="same")])
+
+    assert a.embeddings[0] is not b.embeddings[0]
+    a.embeddings[0].vector.append(0.0)
+    assert b.embeddings[0].vector == [4.0]
+    assert c.embeddings[0].vector == [4.0]
+
+
+def test_identical_texts_do_not_share_sparse_embeddings():
+    embedder = ChunkEmbedder(client=SparseFakeEmbedder(), embedding_name="sparse")
+    chunks = [Chunk(id="a", text="same"), Chunk(id="b", text="same")]
+
+    a, b = asyncio.run(embedder.a_embed(chunks))
+
+    assert a.embeddings[0] is not b.embeddings[0]
+    assert a.embeddings[0].indices is not b.embeddings[0].indices
+    assert b.embeddings[0] == SparseEmbedding(name="sparse", values=[1.0], indices=[4])
@@ -0,0 +1,195 @@
+"""Building blocks for memory adapters that emit Chat Completions style messages.
+
+Shared by the OpenAI-compatible adapters (OpenAI-like, WatsonX) so that media
+encoding and tool-call serialization behave the same across providers.
+"""
+
+import base64
+import contextlib
+import functools
+import json
+import mmap
+import os
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from datapizza.type import FunctionCallBlock, MediaBlock
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+T = TypeVar("T")
+
+_MMAP_THRESHOLD = 1 << 20
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+@functools.lru_cache(maxsize=32)
+def _encode_small_file(path: str, mtime_ns: int, size: int, prefix: bytes) -> str:
+    # Only files under _MMAP_THRESHOLD are cached, which bounds the cache to
+    # roughly 32 x 1.4 MB of base64
+    if not size:
+        return prefix.decode("ascii")
+    # One read syscall into a single buffer, no BufferedReader
+    fd = os.open(path, _READ_FLAGS)
+    try:
+        data = os.read(fd, size)
+    finally:
+        os.close(fd)
+    return (prefix + base64.b64encode(data)).decode("ascii")
+
+
+def _encode_mapped_file(path: str, prefix: bytes) -> str:
+    # Encode straight from the page cache instead of copying the file into bytes
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        return (prefix + base64.b64encode(mapped)).decode("ascii")
+
+
+def encode_path(path: str, prefix: str = "") -> str:
+    """Base64-encode a file, reusing the cached payload while a small file is unchanged.
+
+    A data: URL prefix is joined at the bytes level and cached along with the
+    payload, so repeated turns do not copy the encoded file again. Files of
+    1 MiB or more are encoded on every call rather than kept in memory.
+    """
+    stat = os.stat(path)
+    if stat.st_size < _MMAP_THRESHOLD:
+        return _encode_small_file(
+            path, stat.st_mtime_ns, stat.st_size, prefix.encode("ascii")
+        )
+    return _encode_mapped_file(path, prefix.encode("ascii"))
+
+
+_IMAGE_URL_PREFIXES = {
+    extension: f"data:image/{extension};base64,"
+    for extension in ("png", "jpeg", "jpg", "webp", "gif")
+}
+_APPLICATION_URL_PREFIXES = {"pdf": "data:application/pdf;base64,"}
+
+
+def image_url_prefix(extension: str | None) -> str:
+    return _IMAGE_URL_PREFIXES.get(extension) or f"data:image/{extension};base64,"
+
+
+def application_url_prefix(extension: str | None) -> str:
+    return (
+        _APPLICATION_URL_PREFIXES.get(extension)
+        or f"data:application/{extension};base64,"
+    )
+
+
+def handler_for(handlers: dict[type, T], cls: type) -> T | None:
+    """Look up `cls` in a type-keyed dispatch table, falling back to its bases.
+
+    The exact-type hit is the common case; subclasses of a block type are
+    resolved through the MRO so they are handled like their parent.
+    """
+    handler = handlers.get(cls)
+    if handler is None:
+        for base in cls.__mro__[1:]:
+            handler = handlers.get(base)
+            if handler is not None:
+                break
+    return handler
+
+
+def dumps(obj: Any) -> str:
+    # orjson is an optional speedup; it rejects a few inputs json accepts
+    # (non-str keys, ints over 64 bits), so those fall back to the stdlib.
+    # Both paths emit compact, unescaped UTF-8 so the output does not depend
+    # on whether orjson is installed.
+    if orjson is not None:
+        with contextlib.suppress(TypeError):
+            return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def dump_arguments(block: FunctionCallBlock) -> str:
+    """Serialize tool-call arguments once per block, as turns are re-sent every step."""
+    cached = getattr(block, "_arguments_json", None)
+    if cached is None:
+        cached = dumps(block.arguments)
+        block._arguments_json = cached  # type: ignore[attr-defined]
+    return cached
+
+
+def tool_call(block: FunctionCallBlock) -> dict:
+    return {
+        "id": block.id,
+        "type": "function",
+        "function": {"name": block.name, "arguments": dump_arguments(block)},
+    }
+
+
+def _audio_from_path(block: MediaBlock) -> dict:
+    media = block.media
+    return {
+        "type": "input_audio",
+        "input_audio": {
+            "data": encode_path(media.source),
+            "format": media.extension,
+        },
+    }
+
+
+def _audio_from_base64(block: MediaBlock) -> dict:
+    media = block.media
+    return {
+        "type": "input_audio",
+        "input_audio": {
+            "data": media.source,
+            "format": media.extension,
+        },
+    }
+
+
+def _audio_from_raw(block: MediaBlock) -> dict:
+    media = block.media
+    return {
+        "type": "input_audio",
+        "input_audio": {
+            "data": base64.b64encode(media.source).decode("ascii"),
+            "format": media.extension,
+        },
+    }
+
+
+def _image_from_url(block: MediaBlock) -> dict:
+    return {"type": "image_url", "image_url": {"url": block.media.source}}
+
+
+def _image_from_base64(block: MediaBlock) -> dict:
+    media = block.media
+    return {
+        "type": "image_url",
+        "image_url": {"url": image_url_prefix(media.extension) + media.source},
+    }
+
+
+def _image_from_path(block: MediaBlock) -> dict:
+    media = block.media
+    return {
+        "type": "image_url",
+        "image_url": {
+            "url": encode_path(media.source, image_url_prefix(media.extension))
+        },
+    }
+
+
+# Media converters keyed by Media.source_type
+AUDIO_HANDLERS: dict[str, Callable[[MediaBlock], dict]] = {
+    "path": _audio_from_path,
+    "base_64": _audio_from_base64,
+    "raw": _audio_from_raw,
+}
+IMAGE_HANDLERS: dict[str, Callable[[MediaBlock], dict]] = {
+    "url": _image_from_url,
+    "base64": _image_from_base64,
+    "path": _image_from_path,
+}
@@ -0,0 +1,53 @@
+import base64
+
+import pytest
+
+from datapizza.memory import chat_format
+
+
+def test_encode_path_caches_small_files(tmp_path):
+    path = tmp_path / "small.bin"
+    path.write_bytes(b"small")
+    chat_format._encode_small_file.cache_clear()
+
+    first = chat_format.encode_path(str(path), "data:x;base64,")
+
+    assert first == "data:x;base64," + base64.b64encode(b"small").decode()
+    assert chat_format.encode_path(str(path), "data:x;base64,") is first
+    assert chat_format._encode_small_file.cache_info().currsize == 1
+
+
+def test_encode_path_does_not_cache_large_files(tmp_path):
+    path = tmp_path / "large.bin"
+    data = b"x" * chat_format._MMAP_THRESHOLD
+    path.write_bytes(data)
+    chat_format._encode_small_file.cache_clear()
+
+    assert chat_format.encode_path(str(path)) == base64.b64encode(data).decode()
+    assert chat_format._encode_small_file.cache_info().currsize == 0
+
+
+def test_handler_for_falls_back_to_base_classes():
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    handlers = {Base: "base"}
+
+    assert chat_format.handler_for(handlers, Base) == "base"
+    assert chat_format.handler_for(handlers, Child) == "base"
+    assert chat_format.handler_for(handlers, int) is None
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_keeps_non_ascii_arguments(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(chat_format, "orjson", None)
+    elif chat_format.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    assert chat_format.dumps({"city": "Napoli è più bella"}) == (
+        '{"city":"Napoli è più bella"}'
+    )
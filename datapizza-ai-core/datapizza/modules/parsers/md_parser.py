@@ -3,6 +3,10 @@ import re
 from datapizza.core.modules.parser import Parser
 from datapizza.type import Node, NodeType
 
+from .text_parser import _SENTENCE_PATTERN
+
+_HEADER_PATTERN = re.compile(r"^(#+)\s+(.*)")
+
 
 class MDParser(Parser):
     """
@@ -14,11 +18,9 @@ class MDParser(Parser):
         """Initialize the MDParser."""
         super().__init__()
         # Regex pattern for splitting text into sentences (same as TextParser)
-        self.sentence_pattern = re.compile(
-            r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s"
-        )
+        self.sentence_pattern = _SENTENCE_PATTERN
         # Regex to match markdown headers
-        self.header_pattern = re.compile(r"^(#+)\s+(.*)")
+        self.header_pattern = _HEADER_PATTERN
 
     def parse(self, file_path: str, metadata: dict | None = None) -> Node:
         """
@@ -126,4 +128,4 @@ class MDParser(Parser):
     def _split_sentences(self, text: str) -> list[str]:
         """Split text into sentences."""
         sentences = self.sentence_pattern.split(text)
-        return [s.strip() for s in sentences if s.strip()]
+        return [stripped for s in sentences if (stripped := s.strip())]
@@ -25,3 +25,11 @@ def test_base_parser():
     assert document.children[0].content == "Hello, world!"
     assert document.children[1].content == "This is a test. this is a sentence."
     assert len(document.children[1].children) == 2
+
+
+def test_base_parser_windows_newlines():
+    document = TextParser().parse("First paragraph.\r\n\r\nSecond one. Two sentences.")
+
+    assert len(document.children) == 2
+    assert document.children[0].content == "First paragraph."
+    assert len(document.children[1].children) == 2
@@ -3,6 +3,11 @@ import re
 from datapizza.core.modules.parser import Parser
 from datapizza.type import Node, NodeType
 
+# Compiled once and shared by every parser instance (MDParser reuses it too)
+_SENTENCE_PATTERN = re.compile(r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s")
+# Deletes carriage returns so Windows paragraph breaks become plain "\n\n"
+_STRIP_CR = str.maketrans("", "", "\r")
+
 
 class TextParser(Parser):
     """
@@ -13,9 +18,7 @@ class TextParser(Parser):
     def __init__(self):
         """Initialize the TextParser."""
         # Regex pattern for splitting text into sentences
-        self.sentence_pattern = re.compile(
-            r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s"
-        )
+        self.sentence_pattern = _SENTENCE_PATTERN
 
     def parse(self, text: str, metadata: dict | None = None) -> Node:
         """
@@ -47,12 +50,13 @@ class TextParser(Parser):
 
             # Process each sentence
             for j, sentence_text in enumerate(sentences):
+                sentence_text = sentence_text.strip()
                 # Create sentence node with the text content in its metadata
                 sentence_node = Node(
                     children=[],
-                    metadata={"index": j, "text": sentence_text.strip()},
+                    metadata={"index": j, "text": sentence_text},
                     node_type=NodeType.SENTENCE,
-                    content=sentence_text.strip(),
+                    content=sentence_text,
                 )
 
                 # Add sentence node to paragraph
@@ -69,13 +73,13 @@ class TextParser(Parser):
     def _split_paragraphs(self, text: str) -> list[str]:
         """Split text into paragraphs based on double newlines."""
         # Split by double newlines and filter out empty paragraphs
-        paragraphs = text.strip().split("\n\n")
-        return [p.strip() for p in paragraphs if p.strip()]
+        paragraphs = text.strip().translate(_STRIP_CR).split("\n\n")
+        return [stripped for p in paragraphs if (stripped := p.strip())]
 
     def _split_sentences(self, paragraph: str) -> list[str]:
         """Split paragraph into sentences."""
         sentences = self.sentence_pattern.split(paragraph)
-        return [s.strip() for s in sentences if s.strip()]
+        return [stripped for s in sentences if (stripped := s.strip())]
 
 
 def parse_text(text: str, metadata: dict | None = None) -> Node:
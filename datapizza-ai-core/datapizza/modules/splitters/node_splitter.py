@@ -25,29 +25,56 @@ class NodeSplitter(Splitter):
             if node.content
         ]
 
-    def split(self, node: Node) -> list[Chunk]:
-        """
-        Split the node into chunks.
-
-        Args:
-            node: The node to split
+    @staticmethod
+    def _content_lengths(root: Node) -> dict[int, int]:
+        """Length of every node's content, keyed by id, without building the text.
 
-        Returns:
-            A list of chunks
+        Mirrors Node.content: a leaf's own text, otherwise its children's contents
+        joined by single spaces. Measuring node.content at every level would
+        rebuild the joined text of each subtree once per ancestor.
         """
-        if len(node.content) <= self.max_char:
+        lengths: dict[int, int] = {}
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            children = node.children
+            if not children:
+                lengths[id(node)] = len(node.content)
+            elif expanded:
+                lengths[id(node)] = (
+                    sum(lengths[id(child)] for child in children) + len(children) - 1
+                )
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in children)
+        return lengths
+
+    def _split(self, node: Node, lengths: dict[int, int]) -> list[Chunk]:
+        if lengths[id(node)] <= self.max_char:
             return self._node_to_chunks([node])
 
         result = []
 
         for child in node.children:
-            result.extend(self.split(node=child))
+            result.extend(self._split(child, lengths))
 
         if not result:
             return self._node_to_chunks([node])
 
         return result
 
+    def split(self, node: Node) -> list[Chunk]:
+        """
+        Split the node into chunks.
+
+        Args:
+            node: The node to split
+
+        Returns:
+            A list of chunks
+        """
+        return self._split(node, self._content_lengths(node))
+
     def __call__(self, node: Node) -> list[Chunk]:
         return self.split(node)
 
@@ -1,8 +1,11 @@
+import bisect
 import uuid
 
 from datapizza.core.modules.splitter import Splitter
 from datapizza.type.type import Chunk, Node
 
+from .utils import chunk_ids
+
 
 class RecursiveSplitter(Splitter):
     """
@@ -21,8 +24,9 @@ class RecursiveSplitter(Splitter):
         self.max_char = max_char
         self.overlap = overlap
 
-    def _nodes_to_chunk(self, nodes: list[Node]) -> Chunk:
-        chunk_id = str(uuid.uuid4())
+    def _nodes_to_chunk(self, nodes: list[Node], chunk_id: str | None = None) -> Chunk:
+        if chunk_id is None:
+            chunk_id = str(uuid.uuid4())
         chunk_text = " ".join([node.content for node in nodes])
         # check if "boundingRegions" is in the metadata and if it is, merge them
         bounding_regions = [node.metadata.get("boundingRegions", []) for node in nodes]
@@ -34,11 +38,16 @@ class RecursiveSplitter(Splitter):
         return Chunk(id=chunk_id, text=chunk_text, metadata=chunk_metadata)
 
     def get_all_leaves(self, node: Node) -> list[Node]:
-        if not node.children:
-            return [node]
+        # Explicit stack: no per-level list copies and no recursion limit on deep trees
         leaves = []
-        for child in node.children:
-            leaves.extend(self.get_all_leaves(child))
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            children = current.children
+            if children:
+                stack.extend(reversed(children))
+            else:
+                leaves.append(current)
         return leaves
 
     def split(self, node: Node) -> list[Chunk]:
@@ -52,49 +61,45 @@ class RecursiveSplitter(Splitter):
             A list of chunks
         """
         all_leaves = self.get_all_leaves(node)
+        ids = chunk_ids()
         result = []
         list_nodes = []
-        current_length = 0
+        # prefix[i] is the total length of list_nodes[:i], so overlap cut points
+        # can be found with a binary search instead of re-measuring nodes
+        prefix = [0]
 
-        while all_leaves:
-            current_node = all_leaves.pop(0)
+        for current_node in all_leaves:
             node_content_length = len(current_node.content)
+            current_length = prefix[-1]
 
             # If adding this node would exceed max_char, create a chunk from collected nodes
             if current_length + node_content_length > self.max_char and list_nodes:
-                result.append(self._nodes_to_chunk(list_nodes))
+                result.append(self._nodes_to_chunk(list_nodes, next(ids)))
                 # Handle overlap if specified
                 if self.overlap > 0:
-                    # Keep some nodes for overlap in the next chunk
-                    overlap_size = 0
-                    overlap_nodes = []
-                    for i in range(len(list_nodes) - 1, -1, -1):
-                        node_len = len(list_nodes[i].content)
-                        if overlap_size + node_len <= self.overlap:
-                            overlap_nodes.insert(0, list_nodes[i])
-                            overlap_size += node_len
-                        else:
-                            break
-                    list_nodes = overlap_nodes
-                    current_length = overlap_size
+                    # Keep the longest run of trailing nodes that fits in the overlap
+                    cut = bisect.bisect_left(prefix, current_length - self.overlap)
+                    list_nodes = list_nodes[cut:]
+                    base = prefix[cut]
+                    prefix = [length - base for length in prefix[cut:]]
                 else:
                     list_nodes = []
-                    current_length = 0
+                    prefix = [0]
 
             # If the node itself is too large, create a chunk just for it
             if node_content_length > self.max_char:
                 if list_nodes:
-                    result.append(self._nodes_to_chunk(list_nodes))
+                    result.append(self._nodes_to_chunk(list_nodes, next(ids)))
                     list_nodes = []
-                    current_length = 0
-                result.append(self._nodes_to_chunk([current_node]))
+                    prefix = [0]
+                result.append(self._nodes_to_chunk([current_node], next(ids)))
             else:
                 list_nodes.append(current_node)
-                current_length += node_content_length
+                prefix.append(prefix[-1] + node_content_length)
 
         # Don't forget remaining nodes
         if list_nodes:
-            result.append(self._nodes_to_chunk(list_nodes))
+            result.append(self._nodes_to_chunk(list_nodes, next(ids)))
 
         return result
 
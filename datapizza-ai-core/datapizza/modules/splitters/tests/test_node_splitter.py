@@ -41,3 +41,14 @@ def test_process_large_content_no_children():
     result = splitter.run(node)
     assert len(result) == 1  # Should return original node if no way to split
     assert result[0].text == content
+
+
+def test_process_nested_children():
+    """Test that only subtrees over the limit are descended into"""
+    splitter = NodeSplitter(max_char=15)
+    small = Node(children=[Node(content="one"), Node(content="two")])
+    large = Node(children=[Node(content="three is long"), Node(content="four")])
+    root = Node(children=[small, large])
+
+    result = splitter.run(root)
+    assert [chunk.text for chunk in result] == ["one two", "three is long", "four"]
@@ -6,3 +6,23 @@ def test_recursive_splitter():
     recursive_splitter = RecursiveSplitter(max_char=10, overlap=0)
     chunks = recursive_splitter.split(Node(content="This is a test string"))
     assert len(chunks) == 1
+
+
+def test_recursive_splitter_overlap_keeps_trailing_nodes():
+    leaves = [Node(content=text) for text in ("aaaa", "bb", "cc", "dddd", "e")]
+    chunks = RecursiveSplitter(max_char=8, overlap=4).split(Node(children=leaves))
+
+    # Each chunk carries over the trailing nodes that fit within the overlap
+    assert [c.text for c in chunks] == ["aaaa bb cc", "bb cc dddd", "dddd e"]
+
+
+def test_get_all_leaves_keeps_document_order():
+    tree = Node(
+        children=[
+            Node(children=[Node(content="a"), Node(content="b")]),
+            Node(content="c"),
+            Node(children=[Node(children=[Node(content="d")]), Node(content="e")]),
+        ]
+    )
+    leaves = RecursiveSplitter().get_all_leaves(tree)
+    assert [leaf.content for leaf in leaves] == ["a", "b", "c", "d", "e"]
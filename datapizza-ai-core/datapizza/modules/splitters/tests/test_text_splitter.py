@@ -1,3 +1,5 @@
+import uuid
+
 from datapizza.modules.splitters.text_splitter import TextSplitter
 
 
@@ -22,3 +24,22 @@ def test_text_splitter_with_overlap():
     assert chunks[1].metadata.get("start_char") == 8
     assert chunks[1].metadata.get("end_char") == 18
     assert chunks[2].text == "tring"
+
+
+def test_text_splitter_window_boundaries():
+    # Text ending exactly on a window edge must not produce an empty tail chunk
+    chunks = TextSplitter(max_char=5, overlap=0).run("ABCDEFGHIJ")
+    assert [c.text for c in chunks] == ["ABCDE", "FGHIJ"]
+
+    # Overlap >= max_char still advances one character per chunk
+    chunks = TextSplitter(max_char=3, overlap=5).run("ABCDE")
+    assert [c.text for c in chunks] == ["ABC", "BCD", "CDE"]
+    assert chunks[-1].metadata == {"start_char": 2, "end_char": 5}
+
+
+def test_text_splitter_chunk_ids_are_unique_uuid4():
+    chunks = TextSplitter(max_char=2, overlap=1).run("ABCDEFGHIJ" * 10)
+
+    ids = [chunk.id for chunk in chunks]
+    assert len(set(ids)) == len(ids)
+    assert all(uuid.UUID(chunk_id).version == 4 for chunk_id in ids)
@@ -3,6 +3,8 @@ import uuid
 from datapizza.core.modules.splitter import Splitter
 from datapizza.type.type import Chunk
 
+from .utils import chunk_ids
+
 
 class TextSplitter(Splitter):
     """
@@ -47,23 +49,19 @@ class TextSplitter(Splitter):
         # Ensure progress even if overlap is large
         step = max(1, self.max_char - max(0, self.overlap))
 
-        chunks: list[Chunk] = []
-        start = 0
-        while start < text_length:
-            end = min(start + self.max_char, text_length)
-            chunk_text = text[start:end]
-            chunks.append(
-                Chunk(
-                    id=str(uuid.uuid4()),
-                    text=chunk_text,
-                    metadata={"start_char": start, "end_char": end},
-                )
+        # Window starts are known upfront: the last one is the first whose
+        # window reaches the end of the text, so it is the only one to clamp
+        max_char = self.max_char
+        starts = range(0, text_length - max_char + step, step)
+        chunks = [
+            Chunk(
+                id=chunk_id,
+                text=text[start : start + max_char],
+                metadata={"start_char": start, "end_char": start + max_char},
             )
-
-            if end >= text_length:
-                break
-            start += step
-
+            for chunk_id, start in zip(chunk_ids(), starts, strict=False)
+        ]
+        chunks[-1].metadata["end_char"] = text_length
         return chunks
 
     async def a_split(self, text: str) -> list[Chunk]:
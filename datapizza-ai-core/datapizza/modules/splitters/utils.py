@@ -0,0 +1,19 @@
+import itertools
+import uuid
+from collections.abc import Iterator
+
+_NODE_MASK = (1 << 48) - 1
+
+
+def chunk_ids() -> Iterator[str]:
+    """Yield distinct UUID4 strings drawn from a single uuid4().
+
+    The ids share one random prefix and count up in the 48-bit node field, so
+    they stay valid version 4 UUIDs (vector stores such as Qdrant require
+    that) without one os.urandom call and UUID object per chunk.
+    """
+    base = uuid.uuid4()
+    prefix = str(base)[:24]
+    node = base.node
+    for i in itertools.count():
+        yield f"{prefix}{(node + i) & _NODE_MASK:012x}"
@@ -6,6 +6,14 @@ from datapizza.core.clients.client import Client
 from datapizza.type import Node, NodeType
 
 log = logging.getLogger(__name__)
+
+# Patterns used to clean every LLM response, compiled once
+_CODE_FENCE_PATTERN = re.compile(
+    r"```xml\\s*(.*?)\\s*```", flags=re.DOTALL | re.IGNORECASE
+)
+_DOCUMENT_PATTERN = re.compile(r"<document>.*</document>", re.DOTALL | re.IGNORECASE)
+_TAG_PATTERN = re.compile(r"(<[^>]+>)")
+
 # Define the system prompt
 SYSTEM_PROMPT = """You are an expert text structuring tool. Your task is to analyze the given text and structure it hierarchically into sections, paragraphs, and sentences.
 Output the structured text using XML-like tags: `<document>`, `<section>`, `<paragraph>`, and `<sentence>`.
@@ -160,20 +168,20 @@ class LLMTreeBuilder:
             # If the tag is unrecognized, treat it as a sentence containing its text
             # This handles potential unexpected tags from the LLM
             print(f"Warning: Unrecognized tag '{element.tag}'. Treating as sentence.")
-            content = (element.text or "").strip()
+            parts = [(element.text or "").strip()]
             for child in (
                 element
             ):  # Also capture text from child elements if any unexpected nesting occurs
-                content += (child.text or "").strip() + (child.tail or "").strip()
-            return Node(node_type=NodeType.SENTENCE, content=content)
+                parts.append((child.text or "").strip())
+                parts.append((child.tail or "").strip())
+            return Node(node_type=NodeType.SENTENCE, content="".join(parts))
 
         if node_type == NodeType.SENTENCE:
             # Leaf node: extract text content
-            content = (element.text or "").strip()
+            parts = [(element.text or "").strip()]
             # Also capture text after potential nested tags if any (shouldn't happen with prompt)
-            for child in element:
-                content += (child.tail or "").strip()
-            return Node(node_type=node_type, content=content)
+            parts.extend((child.tail or "").strip() for child in element)
+            return Node(node_type=node_type, content="".join(parts))
         else:
             # Internal node: recursively parse children
             # Only process child elements, ignore text directly within this node or tails
@@ -187,16 +195,9 @@ class LLMTreeBuilder:
     def _clean_llm_output(self, xml_string: str) -> str:
         """Basic cleaning of LLM output to improve XML parsing robustness."""
         # Remove potential markdown code blocks ```xml ... ```
-        xml_string = re.sub(
-            r"```xml\\s*(.*?)\\s*```",
-            r"\\1",
-            xml_string,
-            flags=re.DOTALL | re.IGNORECASE,
-        )
+        xml_string = _CODE_FENCE_PATTERN.sub(r"\\1", xml_string)
         # Remove potential leading/trailing whitespace or explanations outside the root tag
-        match = re.search(
-            r"<document>.*</document>", xml_string, re.DOTALL | re.IGNORECASE
-        )
+        match = _DOCUMENT_PATTERN.search(xml_string)
         cleaned_xml = (
             match.group(0).strip() if match else xml_string.strip()
         )  # Fallback if no document tag found
@@ -213,7 +214,7 @@ class LLMTreeBuilder:
         # This is a simplified approach; a proper XML parser would handle this better,
         # but ET.fromstring needs valid input first.
         # We split by tags and escape content in between.
-        parts = re.split(r"(<[^>]+>)", cleaned_xml)
+        parts = _TAG_PATTERN.split(cleaned_xml)
         escaped_parts = []
         for i, part in enumerate(parts):
             if i % 2 == 0:  # Text content (even indices)
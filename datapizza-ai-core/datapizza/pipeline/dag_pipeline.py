@@ -1,14 +1,15 @@
 import logging
+from collections import deque
 from copy import deepcopy
 from dataclasses import dataclass
 
 from datapizza.core.models import ChainableProducer, PipelineComponent
-from datapizza.core.utils import replace_env_vars
+from datapizza.core.utils import import_attribute, load_yaml, replace_env_vars
 
 log = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Edge:
     from_node_name: str
     to_node_name: str
@@ -78,32 +79,60 @@ class DagPipeline:
             )
         )
 
-    def _get_nodes_ready_to_run(self, results: dict):
-        ready_nodes = []
-        for node_name in self.nodes:
-            # continue if node is already processed
-            if node_name in results:
-                continue
-
-            # If node has no dependencies, it's ready to be processed
-            if not self._get_edges_to(node_name):
-                ready_nodes.append(node_name)
-                continue
-
-            # Check if all dependencies are resolved
-            dependencies = [d.from_node_name for d in self._get_edges_to(node_name)]
-            if all(dep in results for dep in dependencies):
-                ready_nodes.append(node_name)
-
-        return ready_nodes
+    def _plan(
+        self,
+    ) -> tuple[dict[str, list[Edge]], dict[str, set[str]], dict[str, list[str]]]:
+        """Index the edges once per run.
 
-    def _get_args_for_node(self, node_name: str, _input: dict, results: dict) -> dict:
+        Returns the incoming edges of each node, the dependencies each node is
+        still waiting on, and the dependents of each node in insertion order,
+        so readiness is updated per finished node instead of rescanning every
+        edge for every node after each step.
+        """
+        incoming: dict[str, list[Edge]] = {node_name: [] for node_name in self.nodes}
+        for edge in self.edges:
+            if edge.to_node_name in incoming:
+                incoming[edge.to_node_name].append(edge)
+
+        waiting = {
+            node_name: {edge.from_node_name for edge in edges}
+            for node_name, edges in incoming.items()
+        }
+        dependents: dict[str, list[str]] = {}
+        for node_name, dependencies in waiting.items():
+            for dependency in dependencies:
+                dependents.setdefault(dependency, []).append(node_name)
+
+        return incoming, waiting, dependents
+
+    @staticmethod
+    def _mark_done(
+        node_name: str, waiting: dict[str, set[str]], dependents: dict[str, list[str]]
+    ) -> list[str]:
+        """Record a finished node and return the nodes it made ready to run."""
+        ready = []
+        for dependent in dependents.get(node_name, ()):
+            dependencies = waiting[dependent]
+            dependencies.discard(node_name)
+            if not dependencies:
+                ready.append(dependent)
+        return ready
+
+    def _get_args_for_node(
+        self,
+        node_name: str,
+        _input: dict,
+        results: dict,
+        previous_nodes: list[Edge] | None = None,
+    ) -> dict:
         # Get all the nodes that must be run before the given node
         # get the results from the previous nodes and return them as a dict
 
-        previous_nodes = self._get_edges_to(node_name)
-        # Start with the original input
-        args = deepcopy(_input.get(node_name, {}))
+        if previous_nodes is None:
+            previous_nodes = self._get_edges_to(node_name)
+        # Start with the original input; nodes without one skip the deepcopy
+        node_input = _input.get(node_name)
+        args = deepcopy(node_input) if node_input else {}
 
         for edge in previous_nodes:
             from_node_result = results[edge.from_node_name]
@@ -141,26 +170,26 @@ class DagPipeline:
         """
         processed_nodes = set()
         pipeline_results = {}
-        queue = self._get_nodes_ready_to_run(pipeline_results)
+        incoming, waiting, dependents = self._plan()
+        queue = deque(node_name for node_name in self.nodes if not waiting[node_name])
 
         while queue:
-            node_name = queue.pop(0)
+            node_name = queue.popleft()
 
             if node_name in processed_nodes:
                 continue
 
             node = self.nodes[node_name]
             try:
-                arguments = self._get_args_for_node(node_name, data, pipeline_results)
-                log.debug(f"Arguments for node {node_name}: {list(arguments.keys())}")
+                arguments = self._get_args_for_node(
+                    node_name, data, pipeline_results, incoming[node_name]
+                )
+                log.debug("Arguments for node %s: %s", node_name, list(arguments))
                 node_result = node(**arguments)
                 pipeline_results[node_name] = node_result
                 processed_nodes.add(node_name)
 
-                newly_ready = self._get_nodes_ready_to_run(pipeline_results)
-                for ready_node in newly_ready:
-                    if ready_node not in processed_nodes and ready_node not in queue:
-                        queue.append(ready_node)
+                queue.extend(self._mark_done(node_name, waiting, dependents))
 
             except Exception as e:
                 log.error(f"Error running node {node_name}: {e!s}")
@@ -187,26 +216,26 @@ class DagPipeline:
         """
         processed_nodes = set()
         pipeline_results = {}
-        queue = self._get_nodes_ready_to_run(pipeline_results)
+        incoming, waiting, dependents = self._plan()
+        queue = deque(node_name for node_name in self.nodes if not waiting[node_name])
 
         while queue:
-            node_name = queue.pop(0)
+            node_name = queue.popleft()
 
             if node_name in processed_nodes:
                 continue
 
             node = self.nodes[node_name]
             try:
-                arguments = self._get_args_for_node(node_name, data, pipeline_results)
-                log.debug(f"Arguments for node {node_name}: {list(arguments.keys())}")
+                arguments = self._get_args_for_node(
+                    node_name, data, pipeline_results, incoming[node_name]
+                )
+                log.debug("Arguments for node %s: %s", node_name, list(arguments))
                 node_result = await node.a_run(**arguments)
                 pipeline_results[node_name] = node_result
                 processed_nodes.add(node_name)
 
-                newly_ready = self._get_nodes_ready_to_run(pipeline_results)
-                for ready_node in newly_ready:
-                    if ready_node not in processed_nodes and ready_node not in queue:
-                        queue.append(ready_node)
+                queue.extend(self._mark_done(node_name, waiting, dependents))
 
             except Exception as e:
                 log.error(f"Error running node {node_name}: {e!s}")
@@ -230,14 +259,11 @@ class DagPipeline:
         Returns:
             DagPipeline: The pipeline instance.
         """
-        import importlib
-
-        import yaml
 
         from datapizza.clients import ClientFactory
 
         with open(config_path) as file:
-            config = yaml.safe_load(file)
+            config = load_yaml(file)
 
         constants = config.get("constants", [])
         config = replace_env_vars(config, constants)
@@ -259,8 +285,7 @@ class DagPipeline:
                 try:
                     module_name = module_config["name"]
                     module_path = module_config["module"]
-                    module_import = importlib.import_module(module_path)
-                    class_ = getattr(module_import, module_config["type"])
+                    class_ = import_attribute(module_path, module_config["type"])
 
                     params = module_config.get("params", {})
 
@@ -1,5 +1,4 @@
 import copy
-import importlib
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -9,7 +8,7 @@ import yaml
 from opentelemetry import trace
 
 from datapizza.core.models import PipelineComponent
-from datapizza.core.utils import replace_env_vars
+from datapizza.core.utils import import_attribute, load_yaml, replace_env_vars
 
 tracer = trace.get_tracer(__name__)
 log = logging.getLogger(__name__)
@@ -256,7 +255,7 @@ class FunctionalPipeline:
 
                 results = []
                 for item in collection:
-                    log.debug(f"Executing {node_name} for item: {item}")
+                    log.debug("Executing %s for item: %s", node_name, item)
                     # Execute sub-pipeline with the prepared initial data
 
                     if isinstance(to_do, PipelineComponent):
@@ -342,7 +341,7 @@ class FunctionalPipeline:
         """
         try:
             with open(yaml_path) as f:
-                raw_config = yaml.safe_load(f)
+                raw_config = load_yaml(f)
         except FileNotFoundError:
             log.error(f"YAML file not found at path: {yaml_path}")
             raise
@@ -373,9 +372,8 @@ class FunctionalPipeline:
                     class_or_func_name = module_config["type"]
                     params = module_config.get("params", {})
 
-                    imported_module = importlib.import_module(module_path)
-                    class_or_func: PipelineComponent = getattr(
-                        imported_module, class_or_func_name
+                    class_or_func: PipelineComponent = import_attribute(
+                        module_path, class_or_func_name
                     )
 
                     # Process params - resolve node references
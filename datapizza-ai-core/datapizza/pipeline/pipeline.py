@@ -1,12 +1,14 @@
-import importlib
 import logging
 from typing import Any
 
-import yaml
-
 from datapizza.clients import ClientFactory
 from datapizza.core.models import PipelineComponent
-from datapizza.core.utils import replace_env_vars
+from datapizza.core.utils import (
+    gather_bounded,
+    import_attribute,
+    load_yaml,
+    replace_env_vars,
+)
 from datapizza.core.vectorstore import Vectorstore
 from datapizza.type import Chunk
 
@@ -52,8 +54,7 @@ def _instantiate_element(element_config: dict[str, Any]) -> Any:
     class_name = element_config["type"]
     params = element_config.get("params", {})
 
-    module = importlib.import_module(module_path)
-    class_ = getattr(module, class_name)
+    class_ = import_attribute(module_path, class_name)
     return class_(**params)
 
 
@@ -86,6 +87,7 @@ class IngestionPipeline:
         modules: list[PipelineComponent] | None = None,
         vector_store: Vectorstore | None = None,
         collection_name: str | None = None,
+        max_concurrency: int | None = 4,
     ):
         """
         Initialize the ingestion pipeline.
@@ -94,11 +96,13 @@ class IngestionPipeline:
             modules (list[PipelineComponent], optional): List of pipeline components. Defaults to None.
             vector_store (Vectorstore, optional): Vector store to store the ingested data. Defaults to None.
             collection_name (str, optional): Name of the vector store collection to store the ingested data. Defaults to None.
+            max_concurrency (int, optional): Maximum number of files `a_run` processes at once, None for no limit. Defaults to 4.
         """
         self.pipeline = Pipeline(modules)
         self.vector_store = vector_store
         self.collection_name = collection_name
         self.components = modules
+        self.max_concurrency = max_concurrency
 
         if self.vector_store and not self.collection_name:
             raise ValueError("Collection name must be set if vector store is provided")
@@ -187,10 +191,13 @@ class IngestionPipeline:
 
         all_chunks = []
 
-        # Process each file path
-        for fp in file_paths:
-            data = await self.pipeline.a_run(fp)
+        # Files are independent, so run them concurrently and collect in order;
+        # a failing file cancels the others rather than letting them run on
+        results = await gather_bounded(
+            (self.pipeline.a_run(fp) for fp in file_paths), self.max_concurrency
+        )
 
+        for fp, data in zip(file_paths, results, strict=True):
             if not self.vector_store:
                 # If no vector store, accumulate results
                 if isinstance(data, list):
@@ -251,7 +258,7 @@ class IngestionPipeline:
             IngestionPipeline: The ingestion pipeline instance.
         """
         with open(config_path) as file:
-            config = yaml.safe_load(file)
+            config = load_yaml(file)
 
         constants = config.get("constants", {})
         # Use skip_unknown=True to allow element references (like ${my_embedder})
@@ -289,8 +296,7 @@ class IngestionPipeline:
             for component_config in ingestion_pipeline["modules"]:
                 try:
                     module_path = component_config["module"]
-                    module = importlib.import_module(module_path)
-                    class_ = getattr(module, component_config["type"])
+                    class_ = import_attribute(module_path, component_config["type"])
 
                     params = component_config.get("params", {})
 
@@ -322,8 +328,9 @@ class IngestionPipeline:
         if "vector_store" in ingestion_pipeline:
             vector_store_config = ingestion_pipeline["vector_store"]
             vector_store_type = vector_store_config["type"]
-            vector_store_module = importlib.import_module(vector_store_config["module"])
-            vector_store_class = getattr(vector_store_module, vector_store_type)
+            vector_store_class = import_attribute(
+                vector_store_config["module"], vector_store_type
+            )
             vector_store_params = vector_store_config.get("params", {})
             vector_store = vector_store_class(**vector_store_params)
             self.vector_store = vector_store
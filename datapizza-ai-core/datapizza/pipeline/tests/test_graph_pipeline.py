@@ -93,6 +93,29 @@ def test_graph_pipeline_run_with_multiple_keys():
     assert result == {"A": {"output_data": "C"}, "B": "B"}
 
 
+def test_graph_pipeline_runs_nodes_once_dependencies_finish():
+    order = []
+
+    def step(name):
+        def run(**kwargs):
+            order.append(name)
+            return name
+
+        return run
+
+    pipeline = DagPipeline()
+    for name in ("A", "B", "C", "D"):
+        pipeline.add_module(name, step(name))
+    pipeline.connect("A", "C", target_key="a")
+    pipeline.connect("B", "C", target_key="b")
+    pipeline.connect("C", "D", target_key="c")
+
+    result = pipeline.run({})
+
+    assert order == ["A", "B", "C", "D"]
+    assert result == {"A": "A", "B": "B", "C": "C", "D": "D"}
+
+
 def test_graph_pipeline_from_yaml():
     pipeline = DagPipeline()
     pipeline.from_yaml(str(TEST_DIR / "dag_config.yaml"))
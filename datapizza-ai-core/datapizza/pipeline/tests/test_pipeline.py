@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from datapizza.core.models import PipelineComponent
 from datapizza.pipeline import IngestionPipeline
 from datapizza.type import Chunk, DenseEmbedding, Node
@@ -128,6 +130,68 @@ def test_ingestion_pipeline_with_multiple_files():
     assert len(chunks) == 3, f"Expected 3 chunks, got {len(chunks)}"
 
 
+def test_ingestion_pipeline_a_run_keeps_file_order():
+    import asyncio
+
+    from datapizza.modules.splitters.text_splitter import TextSplitter
+
+    pipeline = IngestionPipeline(modules=[TextSplitter(max_char=300)])
+
+    documents = ["Primo documento", "Secondo documento", "Terzo documento"]
+    chunks = asyncio.run(pipeline.a_run(documents))
+
+    assert [chunk.text for chunk in chunks] == documents
+
+
+class _TrackingComponent(PipelineComponent):
+    def __init__(self, fail_on: str | None = None):
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.finished: list[str] = []
+
+    def _run(self, data):
+        return data
+
+    async def _a_run(self, data):
+        import asyncio
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if data == self.fail_on:
+                raise RuntimeError(data)
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        self.finished.append(data)
+        return [Chunk(id=data, text=data)]
+
+
+def test_ingestion_pipeline_a_run_bounds_concurrency():
+    import asyncio
+
+    component = _TrackingComponent()
+    pipeline = IngestionPipeline(modules=[component], max_concurrency=2)
+
+    chunks = asyncio.run(pipeline.a_run([f"doc{i}" for i in range(5)]))
+
+    assert [chunk.text for chunk in chunks] == [f"doc{i}" for i in range(5)]
+    assert component.max_in_flight == 2
+
+
+def test_ingestion_pipeline_a_run_cancels_other_files_on_error():
+    import asyncio
+
+    component = _TrackingComponent(fail_on="bad")
+    pipeline = IngestionPipeline(modules=[component], max_concurrency=None)
+
+    with pytest.raises(RuntimeError, match="bad"):
+        asyncio.run(pipeline.a_run(["doc0", "bad", "doc1"]))
+
+    assert component.finished == []
+
+
 def test_ingestion_pipeline_list_validation():
     """Test that invalid list elements are rejected."""
     from datapizza.modules.splitters.text_splitter import TextSplitter
@@ -217,3 +281,15 @@ def test_pipeline_from_yaml_backward_compatibility():
     # Should work exactly as before
     assert len(pipeline.pipeline.components) == 4
     assert pipeline.collection_name == "test"
+
+
+def test_import_attribute_sees_patched_attributes():
+    from unittest.mock import patch
+
+    from datapizza.core.utils import import_attribute
+    from datapizza.modules.splitters import text_splitter
+
+    module_path = "datapizza.modules.splitters.text_splitter"
+    assert import_attribute(module_path, "TextSplitter") is text_splitter.TextSplitter
+    with patch.object(text_splitter, "TextSplitter") as fake:
+        assert import_attribute(module_path, "TextSplitter") is fake
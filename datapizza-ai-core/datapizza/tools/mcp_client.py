@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import asyncio
+import contextlib
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Coroutine
 from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import timedelta
-from typing import Any
+from typing import Any, TypeVar
 
 import mcp.types as types
 from mcp.client.session import ClientSession, SamplingFnT
@@ -15,6 +21,30 @@ from pydantic import AnyUrl
 from datapizza.core.executors.async_executor import AsyncExecutor
 from datapizza.tools import Tool
 
+T = TypeVar("T")
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _arguments_key(arguments: dict[str, Any]) -> bytes | None:
+    """Digest of the canonical JSON of tool arguments, or None if unserializable."""
+    encoded = None
+    if orjson is not None:
+        with contextlib.suppress(TypeError):
+            encoded = orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS)
+    if encoded is None:
+        try:
+            encoded = json.dumps(
+                arguments, sort_keys=True, separators=(",", ":")
+            ).encode("utf-8")
+        except (TypeError, ValueError):
+            return None
+    # A 128-bit digest keeps LRU keys small however large the arguments are
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
 
 class MCPClient:
     """
@@ -51,6 +81,11 @@ class MCPClient:
         env: The environment variables to pass to the MCP server.
         timeout: The timeout for the MCP server.
         sampling_callback: The sampling callback to pass to the MCP server.
+        cache_ttl: Seconds to reuse the tool and prompt listings for while in
+            persistent mode. Set to 0 to always query the server.
+        cache_tools: Opt-in result caching for deterministic tools, mapping a
+            tool name to the seconds its results stay valid for.
+        tool_cache_size: The maximum number of cached tool results.
     """
 
     def __init__(
@@ -63,6 +98,9 @@ class MCPClient:
         env: dict[str, str] | None = None,
         timeout: int = 30,
         sampling_callback: SamplingFnT | None = None,
+        cache_ttl: float = 60,
+        cache_tools: dict[str, float] | None = None,
+        tool_cache_size: int = 256,
     ) -> None:
         self.url = url
         self.command = command
@@ -71,11 +109,22 @@ class MCPClient:
         self.timeout = timeout
         self.headers = headers or {}
         self.sampling_callback = sampling_callback
+        self.cache_ttl = cache_ttl
+        self.cache_tools = cache_tools or {}
+        self.tool_cache_size = tool_cache_size
 
         # Persistent session state
         self._persistent_session: ClientSession | None = None
         self._exit_stack: AsyncExitStack | None = None
 
+        # (fetched_at, value) listings, only kept for the persistent session
+        self._tools_cache: tuple[float, list[Tool]] | None = None
+        self._prompts_cache: tuple[float, types.ListPromptsResult] | None = None
+        # LRU of (tool_name, arguments digest) -> (fetched_at, result)
+        self._tool_results: OrderedDict[
+            tuple[str, bytes], tuple[float, types.CallToolResult]
+        ] = OrderedDict()
+
         if not url and not command:
             raise ValueError("Either url or command must be provided")
         if url and command:
@@ -83,44 +132,47 @@ class MCPClient:
 
     async def __aenter__(self) -> MCPClient:
         """Enter persistent session mode."""
-        self._exit_stack = AsyncExitStack()
-        await self._exit_stack.__aenter__()
+        # Contexts are entered on a local stack and only handed over once the
+        # session is initialized, so a failed connect unwinds what was opened
+        async with AsyncExitStack() as stack:
+            if self.url:
+                read_stream, write_stream, _ = await stack.enter_async_context(
+                    streamablehttp_client(
+                        self.url,
+                        headers=self.headers or None,
+                        timeout=self._get_timeout,
+                    )
+                )
+            elif self.command:
+                server_parameters = StdioServerParameters(
+                    command=self.command,
+                    args=self.args,
+                    env=self.env or None,
+                )
+                read_stream, write_stream = await stack.enter_async_context(
+                    stdio_client(server_parameters)
+                )
+            else:
+                raise ValueError("Either url or command must be provided")
 
-        if self.url:
-            read_stream, write_stream, _ = await self._exit_stack.enter_async_context(
-                streamablehttp_client(
-                    self.url,
-                    headers=self.headers or None,
-                    timeout=self._get_timeout,
+            session = await stack.enter_async_context(
+                ClientSession(
+                    read_stream,
+                    write_stream,
+                    read_timeout_seconds=self._get_timeout,
+                    sampling_callback=self.sampling_callback,
                 )
             )
-        elif self.command:
-            server_parameters = StdioServerParameters(
-                command=self.command,
-                args=self.args,
-                env=self.env or None,
-            )
-            read_stream, write_stream = await self._exit_stack.enter_async_context(
-                stdio_client(server_parameters)
-            )
-        else:
-            raise ValueError("Either url or command must be provided")
+            await session.initialize()
+            self._exit_stack = stack.pop_all()
 
-        session = await self._exit_stack.enter_async_context(
-            ClientSession(
-                read_stream,
-                write_stream,
-                read_timeout_seconds=self._get_timeout,
-                sampling_callback=self.sampling_callback,
-            )
-        )
-        await session.initialize()
         self._persistent_session = session
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit persistent session mode and cleanup resources."""
         self._persistent_session = None
+        self.invalidate_cache()
         if self._exit_stack:
             await self._exit_stack.__aexit__(exc_type, exc_val, exc_tb)
             self._exit_stack = None
@@ -129,6 +181,30 @@ class MCPClient:
     def _get_timeout(self) -> timedelta:
         return timedelta(seconds=self.timeout)
 
+    def invalidate_cache(self) -> None:
+        """Drop the cached tool and prompt listings."""
+        self._tools_cache = None
+        self._prompts_cache = None
+
+    def _cached(self, entry: tuple[float, Any] | None) -> Any:
+        if entry is None or not self.is_persistent:
+            return None
+        fetched_at, value = entry
+        if time.monotonic() - fetched_at >= self.cache_ttl:
+            return None
+        return value
+
+    def _run_sync(self, method: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Run an async method to completion from sync code."""
+        if self.is_persistent:
+            # The persistent session's streams belong to the caller's event
+            # loop, which would be blocked while the executor loop waits on them
+            raise RuntimeError(
+                f"{method.__name__.removeprefix('a_')}() cannot be used in persistent "
+                f"mode, await {method.__name__}() instead"
+            )
+        return AsyncExecutor.get_instance().run(method(), timeout=self.timeout)
+
     @property
     def is_persistent(self) -> bool:
         """Return True if the client is in persistent session mode."""
@@ -201,13 +277,92 @@ class MCPClient:
         Returns:
             The result of the tool call.
         """
+        key, cached = (
+            self._cached_result(tool_name, arguments)
+            if progress_callback is None
+            else (None, None)
+        )
+        if cached is not None:
+            return cached
+
         async with self._session() as session:
-            return await session.call_tool(
+            result = await session.call_tool(
                 tool_name,
                 arguments=arguments or {},
                 progress_callback=progress_callback,
             )
 
+        self._store_result(key, result)
+        return result
+
+    def _cached_result(
+        self, tool_name: str, arguments: dict[str, Any] | None
+    ) -> tuple[tuple[str, bytes] | None, types.CallToolResult | None]:
+        """Return the cache key for a call, if cacheable, and any fresh result."""
+        ttl = self.cache_tools.get(tool_name)
+        if ttl is None:
+            return None, None
+        arguments_key = _arguments_key(arguments or {})
+        if arguments_key is None:
+            return None, None
+        key = (tool_name, arguments_key)
+        entry = self._tool_results.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            self._tool_results.move_to_end(key)
+            return key, entry[1]
+        return key, None
+
+    def _store_result(
+        self, key: tuple[str, bytes] | None, result: types.CallToolResult
+    ) -> None:
+        if key is None or result.isError:
+            return
+        self._tool_results[key] = (time.monotonic(), result)
+        self._tool_results.move_to_end(key)
+        if len(self._tool_results) > self.tool_cache_size:
+            self._tool_results.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached tool results."""
+        self._tool_results.clear()
+
+    async def a_call_tools_batch(
+        self, calls: list[tuple[str, dict[str, Any] | None]]
+    ) -> list[types.CallToolResult]:
+        """
+        Call several tools concurrently over a single session.
+
+        In stateless mode one session is opened for the whole batch instead of
+        one per call; in persistent mode the calls share the open session.
+
+        Args:
+            calls: ``(tool_name, arguments)`` pairs to call.
+
+        Tools opted into ``cache_tools`` are served from and stored in the
+        result cache as with :meth:`call_tool`.
+
+        Returns:
+            The results of the tool calls, in the same order as ``calls``.
+        """
+        lookups = [self._cached_result(name, arguments) for name, arguments in calls]
+        results = [cached for _, cached in lookups]
+        misses = [i for i, result in enumerate(results) if result is None]
+        if not misses:
+            return results  # type: ignore[return-value]
+
+        async with self._session() as session:
+            fetched = await asyncio.gather(
+                *(
+                    session.call_tool(calls[i][0], arguments=calls[i][1] or {})
+                    for i in misses
+                )
+            )
+
+        for i, result in zip(misses, fetched, strict=True):
+            self._store_result(lookups[i][0], result)
+            results[i] = result
+        return results  # type: ignore[return-value]
+
     def list_tools(self) -> list[Tool]:
         """
         List the tools available on the MCP server.
@@ -215,7 +370,7 @@ class MCPClient:
         Returns:
             A list of :class:`Tool` objects.
         """
-        return AsyncExecutor.get_instance().run(self.a_list_tools(), timeout=10)
+        return self._run_sync(self.a_list_tools)
 
     async def a_list_tools(self) -> list[Tool]:
         """
@@ -224,38 +379,38 @@ class MCPClient:
         Returns:
             A list of :class:`Tool` objects.
         """
+        cached = self._cached(self._tools_cache)
+        if cached is not None:
+            return list(cached)
+
         async with self._session() as session:
             result = await session.list_tools()
 
-        tools: list[Tool] = []
-        for mcp_tool in result.tools:
-            t_name = mcp_tool.name
+        tools = [self._to_tool(mcp_tool) for mcp_tool in result.tools]
+        if self.is_persistent:
+            self._tools_cache = (time.monotonic(), tools)
+        return list(tools)
 
-            def make_execute_tool(tool_name: str):
-                async def execute_tool(**kwargs):
-                    result = await self.call_tool(
-                        tool_name=tool_name,
-                        arguments=kwargs or {},
-                    )
-                    return result.model_dump_json()
-
-                return execute_tool
-
-            schema = mcp_tool.inputSchema or {}
-            properties = schema.get("properties", {})
-            required = schema.get("required", [])
-            tools.append(
-                Tool(
-                    func=make_execute_tool(t_name),
-                    name=mcp_tool.name,
-                    description=mcp_tool.description,
-                    properties=properties,
-                    required=required,
-                    strict=bool(schema.get("additionalProperties") is False),
-                )
+    def _make_execute_tool(self, tool_name: str):
+        async def execute_tool(**kwargs):
+            result = await self.call_tool(
+                tool_name=tool_name,
+                arguments=kwargs or {},
             )
-
-        return tools
+            return result.model_dump_json()
+
+        return execute_tool
+
+    def _to_tool(self, mcp_tool: types.Tool) -> Tool:
+        schema = mcp_tool.inputSchema or {}
+        return Tool(
+            func=self._make_execute_tool(mcp_tool.name),
+            name=mcp_tool.name,
+            description=mcp_tool.description,
+            properties=schema.get("properties", {}),
+            required=schema.get("required", []),
+            strict=bool(schema.get("additionalProperties") is False),
+        )
 
     async def list_resources(self) -> types.ListResourcesResult:
         """
@@ -282,7 +437,7 @@ class MCPClient:
         Returns:
             A :class:`types.ListPromptsResult` object.
         """
-        return AsyncExecutor.get_instance().run(self.a_list_prompts(), timeout=10)
+        return self._run_sync(self.a_list_prompts)
 
     async def a_list_prompts(self) -> types.ListPromptsResult:
         """
@@ -291,8 +446,16 @@ class MCPClient:
         Returns:
             A :class:`types.ListPromptsResult` object.
         """
+        cached = self._cached(self._prompts_cache)
+        if cached is not None:
+            return cached
+
         async with self._session() as session:
-            return await session.list_prompts()
+            result = await session.list_prompts()
+
+        if self.is_persistent:
+            self._prompts_cache = (time.monotonic(), result)
+        return result
 
     async def get_prompt(
         self, prompt_name: str, arguments: dict[str, str] | None = None
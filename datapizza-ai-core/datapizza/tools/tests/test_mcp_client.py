@@ -1,9 +1,11 @@
 """Tests for MCPClient persistent session functionality."""
 
-from unittest.mock import AsyncMock, MagicMock
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from .. import mcp_client
 from ..mcp_client import MCPClient
 
 
@@ -81,6 +83,16 @@ class TestMCPClientSessionLogic:
         assert all(s is mock_session for s in sessions)
         assert len(sessions) == 3
 
+    def test_sync_wrappers_rejected_in_persistent_mode(self):
+        """Sync listing would block the loop that owns the persistent session."""
+        client = MCPClient(url="https://example.com/mcp")
+        client._persistent_session = MagicMock()
+
+        with pytest.raises(RuntimeError, match="await a_list_tools"):
+            client.list_tools()
+        with pytest.raises(RuntimeError, match="await a_list_prompts"):
+            client.list_prompts()
+
 
 class TestMCPClientContextManager:
     """Test the async context manager entry/exit behavior."""
@@ -97,6 +109,34 @@ class TestMCPClientContextManager:
         assert client._persistent_session is None
         assert client.is_persistent is False
 
+    @pytest.mark.asyncio
+    async def test_enter_unwinds_transport_when_initialize_fails(self):
+        """A failed initialize closes the transport and leaves no session."""
+        closed = []
+
+        @asynccontextmanager
+        async def fake_transport(*args, **kwargs):
+            try:
+                yield MagicMock(), MagicMock(), None
+            finally:
+                closed.append(True)
+
+        mock_session = AsyncMock()
+        mock_session.__aenter__.return_value = mock_session
+        mock_session.initialize.side_effect = ConnectionError("boom")
+
+        client = MCPClient(url="https://example.com/mcp")
+        with (
+            patch.object(mcp_client, "streamablehttp_client", fake_transport),
+            patch.object(mcp_client, "ClientSession", return_value=mock_session),
+            pytest.raises(ConnectionError),
+        ):
+            await client.__aenter__()
+
+        assert closed == [True]
+        assert client._exit_stack is None
+        assert client.is_persistent is False
+
 
 class TestMCPClientCallTool:
     """Test call_tool method behavior."""
@@ -140,6 +180,79 @@ class TestMCPClientCallTool:
             progress_callback=progress_cb,
         )
 
+    @pytest.mark.asyncio
+    async def test_a_call_tools_batch_shares_session(self):
+        """a_call_tools_batch should run every call on one session, in order."""
+        client = MCPClient(url="https://example.com/mcp")
+
+        mock_session = AsyncMock()
+        mock_session.call_tool = AsyncMock(side_effect=lambda name, **_: name)
+        client._persistent_session = mock_session
+
+        results = await client.a_call_tools_batch(
+            [("first", {"arg": 1}), ("second", None)]
+        )
+
+        assert results == ["first", "second"]
+        mock_session.call_tool.assert_any_call("first", arguments={"arg": 1})
+        mock_session.call_tool.assert_any_call("second", arguments={})
+
+    @pytest.mark.asyncio
+    async def test_call_tool_caches_opted_in_tools(self):
+        """Results of cached tools are reused per arguments, with an LRU cap."""
+        client = MCPClient(
+            url="https://example.com/mcp",
+            cache_tools={"weather": 60},
+            tool_cache_size=1,
+        )
+
+        mock_session = AsyncMock()
+        mock_session.call_tool = AsyncMock(
+            side_effect=lambda name, arguments, **_: MagicMock(isError=False)
+        )
+        client._persistent_session = mock_session
+
+        first = await client.call_tool("weather", {"city": "Rome", "unit": "C"})
+        again = await client.call_tool("weather", {"unit": "C", "city": "Rome"})
+        assert again is first
+        assert mock_session.call_tool.call_count == 1
+
+        await client.call_tool("weather", {"city": "Milan"})
+        await client.call_tool("weather", {"city": "Rome", "unit": "C"})
+        assert mock_session.call_tool.call_count == 3
+
+        await client.call_tool("other", {})
+        await client.call_tool("other", {})
+        assert mock_session.call_tool.call_count == 5
+
+        client.clear_cache()
+        await client.call_tool("weather", {"city": "Rome", "unit": "C"})
+        assert mock_session.call_tool.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_a_call_tools_batch_uses_result_cache(self):
+        """Batch calls read and fill the same cache as call_tool."""
+        client = MCPClient(url="https://example.com/mcp", cache_tools={"weather": 60})
+
+        mock_session = AsyncMock()
+        mock_session.call_tool = AsyncMock(
+            side_effect=lambda name, arguments, **_: MagicMock(isError=False)
+        )
+        client._persistent_session = mock_session
+
+        cached = await client.call_tool("weather", {"city": "Rome"})
+        results = await client.a_call_tools_batch(
+            [("weather", {"city": "Rome"}), ("weather", {"city": "Milan"})]
+        )
+
+        assert results[0] is cached
+        assert mock_session.call_tool.call_count == 2
+        assert await client.call_tool("weather", {"city": "Milan"}) is results[1]
+        assert await client.a_call_tools_batch([("weather", {"city": "Milan"})]) == [
+            results[1]
+        ]
+        assert mock_session.call_tool.call_count == 2
+
 
 class TestMCPClientListTools:
     """Test list_tools related methods."""
@@ -172,6 +285,59 @@ class TestMCPClientListTools:
         assert tools[0].name == "test_tool"
         assert tools[0].description == "A test tool"
 
+    @pytest.mark.asyncio
+    async def test_a_list_tools_is_cached_in_persistent_mode(self):
+        """Repeated a_list_tools calls reuse the listing until invalidated."""
+        client = MCPClient(url="https://example.com/mcp")
+
+        mock_tool = MagicMock()
+        mock_tool.name = "test_tool"
+        mock_tool.description = "A test tool"
+        mock_tool.inputSchema = {}
+
+        mock_session = AsyncMock()
+        mock_session.list_tools = AsyncMock(return_value=MagicMock(tools=[mock_tool]))
+        client._persistent_session = mock_session
+
+        first = await client.a_list_tools()
+        second = await client.a_list_tools()
+        assert [t.name for t in first] == [t.name for t in second] == ["test_tool"]
+        mock_session.list_tools.assert_called_once()
+
+        client.invalidate_cache()
+        await client.a_list_tools()
+        assert mock_session.list_tools.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_a_list_tools_not_cached_with_zero_ttl(self):
+        client = MCPClient(url="https://example.com/mcp", cache_ttl=0)
+
+        mock_session = AsyncMock()
+        mock_session.list_tools = AsyncMock(return_value=MagicMock(tools=[]))
+        client._persistent_session = mock_session
+
+        await client.a_list_tools()
+        await client.a_list_tools()
+        assert mock_session.list_tools.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_listed_tool_returns_result_json(self):
+        """Executing a listed tool returns the call result serialized as JSON."""
+        import mcp.types as types
+
+        client = MCPClient(url="https://example.com/mcp")
+        call_result = types.CallToolResult(
+            content=[types.TextContent(type="text", text="héllo")],
+            structuredContent={"value": 1.5},
+        )
+
+        mock_session = AsyncMock()
+        mock_session.call_tool = AsyncMock(return_value=call_result)
+        client._persistent_session = mock_session
+
+        execute = client._make_execute_tool("test_tool")
+        assert await execute(arg="value") == call_result.model_dump_json()
+
 
 class TestMCPClientListPrompts:
     """Test list_prompts related methods."""
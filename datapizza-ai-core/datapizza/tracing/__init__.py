@@ -1,15 +1,32 @@
+from typing import TYPE_CHECKING
+
 from rich.console import Console
 
 console = Console()
 
-from datapizza.tracing.instrumentor import (
-    DatapizzaMonitoringInstrumentor,
-    MissingDatapizzaConfigurationError,
-)
 from datapizza.tracing.tracing import ContextTracing
 
+if TYPE_CHECKING:
+    from datapizza.tracing.instrumentor import (
+        DatapizzaMonitoringInstrumentor,
+        MissingDatapizzaConfigurationError,
+    )
+
 __all__ = [
     "ContextTracing",
     "DatapizzaMonitoringInstrumentor",
     "MissingDatapizzaConfigurationError",
 ]
+
+
+def __getattr__(name: str):
+    # Every client and agent imports datapizza.tracing, but only monitoring
+    # setup needs the instrumentor and the OTLP exporter it pulls in
+    if name in (
+        "DatapizzaMonitoringInstrumentor",
+        "MissingDatapizzaConfigurationError",
+    ):
+        from datapizza.tracing import instrumentor
+
+        return getattr(instrumentor, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,20 @@
+import itertools
 import os
+import time
+import types
+from collections.abc import Sequence
+from typing import Any
 
 from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.http import Compression
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
 from opentelemetry.trace import ProxyTracerProvider
 
 
@@ -12,6 +22,70 @@ class MissingDatapizzaConfigurationError(ValueError):
     pass
 
 
+class _RoundRobinSpanProcessor(SpanProcessor):
+    """Hands each finished span to the next of several processors in turn.
+
+    Every processor owns its own exporter and HTTP session, so batches are
+    exported over independent connections instead of queueing behind one.
+    """
+
+    def __init__(self, processors: list[SpanProcessor]):
+        self._processors = processors
+        self._next = itertools.cycle(processors).__next__
+
+    def on_end(self, span: ReadableSpan) -> None:
+        self._next().on_end(span)
+
+    def shutdown(self) -> None:
+        for processor in self._processors:
+            processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return all(
+            processor.force_flush(timeout_millis) for processor in self._processors
+        )
+
+
+class _CircuitBreakerExporter(SpanExporter):
+    """Stops calling an unhealthy collector for a while after repeated failures.
+
+    Each failed export can spend the whole export timeout retrying, so while
+    the collector is down batches are dropped straight away instead, and one
+    export is let through again once the cool-down has passed.
+    """
+
+    def __init__(
+        self, exporter: SpanExporter, failure_threshold: int, cooldown_seconds: float
+    ):
+        self._exporter = exporter
+        self._failure_threshold = failure_threshold
+        self._cooldown_seconds = cooldown_seconds
+        self._failures = 0
+        self._open_until = 0.0
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        if self._failures >= self._failure_threshold:
+            if time.monotonic() < self._open_until:
+                return SpanExportResult.FAILURE
+            # Half-open: a single failure re-opens the circuit
+            self._failures = self._failure_threshold - 1
+
+        result = self._exporter.export(spans)
+        if result is SpanExportResult.SUCCESS:
+            self._failures = 0
+        else:
+            self._failures += 1
+            if self._failures >= self._failure_threshold:
+                self._open_until = time.monotonic() + self._cooldown_seconds
+        return result
+
+    def shutdown(self) -> None:
+        self._exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._exporter.force_flush(timeout_millis)
+
+
 class DatapizzaMonitoringInstrumentor:
     def __init__(
         self,
@@ -21,6 +95,16 @@ class DatapizzaMonitoringInstrumentor:
         service_name: str | None = None,
         service_version: str | None = None,
         endpoint: str | None = None,
+        max_queue_size: int | None = None,
+        schedule_delay_millis: float | None = None,
+        max_export_batch_size: int | None = None,
+        export_timeout_millis: float | None = None,
+        connection_pool_size: int = 1,
+        compression: str | None = None,
+        circuit_breaker_threshold: int = 5,
+        circuit_breaker_cooldown: float = 30.0,
+        resource_attributes: dict[str, Any] | None = None,
+        detect_resource: bool = True,
     ):
         resolved_api_key = self._resolve_optional_value(api_key, "DATAPIZZA_API_KEY")
         resolved_project_id = self._resolve_optional_value(
@@ -54,8 +138,40 @@ class DatapizzaMonitoringInstrumentor:
             or "0.1.0"
         )
         self.endpoint = resolved_endpoint
+        # Shared read-only by every exporter in the pool
+        self._otlp_headers = types.MappingProxyType(
+            {
+                "x-project-id": self.project_id,
+                "authorization": f"Bearer {self.api_key}",
+            }
+        )
+        # Unset values are resolved by BatchSpanProcessor itself, from the
+        # OTEL_BSP_* environment variables and then the SDK defaults
+        self.max_queue_size = max_queue_size
+        self.schedule_delay_millis = schedule_delay_millis
+        self.max_export_batch_size = max_export_batch_size
+        self.export_timeout_millis = export_timeout_millis
+        if connection_pool_size < 1:
+            raise ValueError("connection_pool_size must be at least 1")
+        self.connection_pool_size = connection_pool_size
+        # Span payloads compress well, so exports are gzipped unless told otherwise
+        self.compression = Compression(
+            self._resolve_optional_value(compression, "OTEL_EXPORTER_OTLP_COMPRESSION")
+            or Compression.Gzip.value
+        )
+        if circuit_breaker_threshold < 1:
+            raise ValueError("circuit_breaker_threshold must be at least 1")
+        self.circuit_breaker_threshold = circuit_breaker_threshold
+        self.circuit_breaker_cooldown = circuit_breaker_cooldown
+
+        self.resource_attributes = dict(resource_attributes or {})
+        # When off, only the attributes set here are exported: no
+        # telemetry.sdk.* defaults and nothing from OTEL_RESOURCE_ATTRIBUTES
+        self.detect_resource = detect_resource
 
         self._is_instrumented = False
+        # The SDK builds a new Tracer on every get_tracer call
+        self._tracers: dict[tuple[str, str | None], trace.Tracer] = {}
 
     @classmethod
     def from_env(cls):
@@ -85,20 +201,7 @@ class DatapizzaMonitoringInstrumentor:
         if self._is_instrumented:
             return
 
-        resource = Resource.create(
-            {
-                "service.name": self.service_name,
-                "service.version": self.service_version,
-            }
-        )
-
-        exporter = OTLPSpanExporter(
-            endpoint=self.endpoint,
-            headers={
-                "x-project-id": self.project_id,
-                "authorization": f"Bearer {self.api_key}",
-            },
-        )
+        resource = self._resource()
 
         current_provider = trace.get_tracer_provider()
         if isinstance(current_provider, ProxyTracerProvider):
@@ -111,14 +214,50 @@ class DatapizzaMonitoringInstrumentor:
                 "Set an OpenTelemetry SDK TracerProvider before calling instrument()."
             )
 
-        span_processor = BatchSpanProcessor(exporter)
+        processors = [self._batch_processor() for _ in range(self.connection_pool_size)]
+        span_processor = (
+            processors[0]
+            if len(processors) == 1
+            else _RoundRobinSpanProcessor(processors)
+        )
         current_provider.add_span_processor(span_processor)
         self._is_instrumented = True
 
+    def _resource(self) -> Resource:
+        attributes = {
+            **self.resource_attributes,
+            "service.name": self.service_name,
+            "service.version": self.service_version,
+        }
+        if self.detect_resource:
+            return Resource.create(attributes)
+        return Resource(attributes)
+
+    def _batch_processor(self) -> BatchSpanProcessor:
+        exporter = OTLPSpanExporter(
+            endpoint=self.endpoint,
+            headers=self._otlp_headers,
+            compression=self.compression,
+        )
+        return BatchSpanProcessor(
+            _CircuitBreakerExporter(
+                exporter,
+                self.circuit_breaker_threshold,
+                self.circuit_breaker_cooldown,
+            ),
+            max_queue_size=self.max_queue_size,
+            schedule_delay_millis=self.schedule_delay_millis,
+            max_export_batch_size=self.max_export_batch_size,
+            export_timeout_millis=self.export_timeout_millis,
+        )
+
     def get_tracer(self, name: str, version: str | None = None):
         if not self._is_instrumented:
             raise RuntimeError(
                 "Datapizza monitoring is not instrumented. Call instrument() first."
             )
 
-        return trace.get_tracer(name, version)
+        tracer = self._tracers.get((name, version))
+        if tracer is None:
+            tracer = self._tracers[(name, version)] = trace.get_tracer(name, version)
+        return tracer
@@ -1,10 +1,16 @@
-from unittest.mock import Mock, patch
+import subprocess
+import sys
+from unittest.mock import ANY, Mock, patch
 
 import pytest
+from opentelemetry.exporter.otlp.proto.http import Compression
+from opentelemetry.sdk.trace.export import SpanExportResult
 
 from datapizza.tracing.instrumentor import (
     DatapizzaMonitoringInstrumentor,
     MissingDatapizzaConfigurationError,
+    _CircuitBreakerExporter,
+    _RoundRobinSpanProcessor,
 )
 
 
@@ -54,6 +60,42 @@ def test_get_tracer_requires_instrument(required_env):
         instrumentor.get_tracer(__name__)
 
 
+def test_resource_attributes_without_detection(required_env, monkeypatch):
+    monkeypatch.setenv("OTEL_RESOURCE_ATTRIBUTES", "host.name=box")
+
+    detected = DatapizzaMonitoringInstrumentor(
+        resource_attributes={"deployment.environment": "prod"}
+    )._resource()
+    assert detected.attributes["deployment.environment"] == "prod"
+    assert detected.attributes["host.name"] == "box"
+    assert "telemetry.sdk.name" in detected.attributes
+
+    trimmed = DatapizzaMonitoringInstrumentor(
+        resource_attributes={"deployment.environment": "prod"},
+        detect_resource=False,
+    )._resource()
+    assert dict(trimmed.attributes) == {
+        "deployment.environment": "prod",
+        "service.name": "datapizza",
+        "service.version": "0.1.0",
+    }
+
+
+def test_get_tracer_reuses_tracers(required_env):
+    instrumentor = DatapizzaMonitoringInstrumentor()
+    instrumentor._is_instrumented = True
+
+    with patch(
+        "datapizza.tracing.instrumentor.trace.get_tracer",
+        side_effect=lambda *args: Mock(),
+    ) as mock_get_tracer:
+        first = instrumentor.get_tracer("agent", "1.0")
+        assert instrumentor.get_tracer("agent", "1.0") is first
+        assert instrumentor.get_tracer("agent") is not first
+
+    assert mock_get_tracer.call_count == 2
+
+
 def test_instrument_adds_span_processor_once(required_env):
     fake_provider = Mock()
 
@@ -75,8 +117,156 @@ def test_instrument_adds_span_processor_once(required_env):
     assert fake_provider.add_span_processor.call_count == 1
 
 
+def test_instrument_forwards_batch_settings(required_env):
+    fake_provider = Mock()
+
+    with (
+        patch(
+            "datapizza.tracing.instrumentor.trace.get_tracer_provider",
+            return_value=fake_provider,
+        ),
+        patch("datapizza.tracing.instrumentor.OTLPSpanExporter") as mock_exporter,
+        patch("datapizza.tracing.instrumentor.BatchSpanProcessor") as mock_processor,
+    ):
+        instrumentor = DatapizzaMonitoringInstrumentor(
+            max_queue_size=4096,
+            schedule_delay_millis=1000,
+            max_export_batch_size=256,
+        )
+        instrumentor.instrument()
+
+    mock_processor.assert_called_once_with(
+        ANY,
+        max_queue_size=4096,
+        schedule_delay_millis=1000,
+        max_export_batch_size=256,
+        export_timeout_millis=None,
+    )
+    exporter = mock_processor.call_args.args[0]
+    assert isinstance(exporter, _CircuitBreakerExporter)
+    assert exporter._exporter is mock_exporter.return_value
+
+
+def test_instrument_pools_exporters_round_robin(required_env):
+    fake_provider = Mock()
+    processors = [Mock(), Mock()]
+
+    with (
+        patch(
+            "datapizza.tracing.instrumentor.trace.get_tracer_provider",
+            return_value=fake_provider,
+        ),
+        patch("datapizza.tracing.instrumentor.OTLPSpanExporter") as mock_exporter,
+        patch(
+            "datapizza.tracing.instrumentor.BatchSpanProcessor",
+            side_effect=processors,
+        ),
+    ):
+        DatapizzaMonitoringInstrumentor(connection_pool_size=2).instrument()
+
+    assert mock_exporter.call_count == 2
+    fake_provider.add_span_processor.assert_called_once()
+    pool = fake_provider.add_span_processor.call_args.args[0]
+    assert isinstance(pool, _RoundRobinSpanProcessor)
+
+    spans = [Mock(), Mock(), Mock()]
+    for span in spans:
+        pool.on_end(span)
+    assert [c.args[0] for c in processors[0].on_end.call_args_list] == [
+        spans[0],
+        spans[2],
+    ]
+    assert [c.args[0] for c in processors[1].on_end.call_args_list] == [spans[1]]
+
+    pool.shutdown()
+    for processor in processors:
+        processor.shutdown.assert_called_once()
+
+
+def test_connection_pool_size_must_be_positive(required_env):
+    with pytest.raises(ValueError):
+        DatapizzaMonitoringInstrumentor(connection_pool_size=0)
+
+
+def test_exporter_uses_gzip_by_default(required_env):
+    with (
+        patch(
+            "datapizza.tracing.instrumentor.trace.get_tracer_provider",
+            return_value=Mock(),
+        ),
+        patch("datapizza.tracing.instrumentor.OTLPSpanExporter") as mock_exporter,
+        patch("datapizza.tracing.instrumentor.BatchSpanProcessor"),
+    ):
+        DatapizzaMonitoringInstrumentor().instrument()
+
+    assert mock_exporter.call_args.kwargs["compression"] is Compression.Gzip
+    assert mock_exporter.call_args.kwargs["headers"] == {
+        "x-project-id": "test_project_id",
+        "authorization": "Bearer test_api_key",
+    }
+
+
+def test_compression_reads_otel_env(required_env, monkeypatch):
+    monkeypatch.setenv("OTEL_EXPORTER_OTLP_COMPRESSION", "none")
+
+    instrumentor = DatapizzaMonitoringInstrumentor()
+    assert instrumentor.compression is Compression.NoCompression
+
+    explicit = DatapizzaMonitoringInstrumentor(compression="deflate")
+    assert explicit.compression is Compression.Deflate
+
+
+def test_circuit_breaker_skips_exports_while_open():
+    exporter = Mock()
+    exporter.export.return_value = SpanExportResult.FAILURE
+    breaker = _CircuitBreakerExporter(
+        exporter, failure_threshold=2, cooldown_seconds=30
+    )
+
+    with patch("datapizza.tracing.instrumentor.time.monotonic", return_value=100.0):
+        breaker.export([])
+        breaker.export([])
+        assert breaker.export([]) is SpanExportResult.FAILURE
+    assert exporter.export.call_count == 2
+
+    exporter.export.return_value = SpanExportResult.SUCCESS
+    with patch("datapizza.tracing.instrumentor.time.monotonic", return_value=131.0):
+        assert breaker.export([]) is SpanExportResult.SUCCESS
+        exporter.export.return_value = SpanExportResult.FAILURE
+        breaker.export([])
+        breaker.export([])
+    assert exporter.export.call_count == 5
+
+
+def test_circuit_breaker_half_open_failure_reopens():
+    exporter = Mock()
+    exporter.export.return_value = SpanExportResult.FAILURE
+    breaker = _CircuitBreakerExporter(
+        exporter, failure_threshold=2, cooldown_seconds=30
+    )
+
+    with patch("datapizza.tracing.instrumentor.time.monotonic", return_value=100.0):
+        breaker.export([])
+        breaker.export([])
+    with patch("datapizza.tracing.instrumentor.time.monotonic", return_value=131.0):
+        breaker.export([])
+        breaker.export([])
+    assert exporter.export.call_count == 3
+
+
 def test_from_env_returns_ready_instrumentor(required_env):
     instrumentor = DatapizzaMonitoringInstrumentor.from_env()
 
     assert isinstance(instrumentor, DatapizzaMonitoringInstrumentor)
     assert instrumentor.api_key == "test_api_key"
+
+
+def test_package_import_defers_instrumentor():
+    # Run in a fresh interpreter, this test module already imported it
+    code = (
+        "import sys, datapizza.tracing\n"
+        "assert 'datapizza.tracing.instrumentor' not in sys.modules\n"
+        "from datapizza.tracing import DatapizzaMonitoringInstrumentor\n"
+        "assert 'datapizza.tracing.instrumentor' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
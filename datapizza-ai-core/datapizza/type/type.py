@@ -386,6 +386,9 @@ class NodeType(Enum):
 class Node:
     """Class representing a node in a document graph."""
 
+    # Parsers build one Node per paragraph/sentence; slots keep each instance small
+    __slots__ = ("_content", "children", "id", "metadata", "node_type")
+
     def __init__(
         self,
         children: list["Node"] | None = None,
@@ -449,6 +452,8 @@ class Node:
 class MediaNode(Node):
     """Class representing a media node in a document graph."""
 
+    __slots__ = ("media",)
+
     def __init__(
         self,
         media: Media,
@@ -471,17 +476,17 @@ class EmbeddingFormat(Enum):
     SPARSE = "sparse"
 
 
-@dataclass
+@dataclass(slots=True)
 class Embedding:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DenseEmbedding(Embedding):
     vector: list[float]
 
 
-@dataclass
+@dataclass(slots=True)
 class SparseEmbedding(Embedding):
     values: list[float]
     indices: list[int]
@@ -493,6 +498,9 @@ class Chunk:
     A class for storing the chunk response from a client.
     """
 
+    # Ingestion creates one Chunk per window/node; slots keep each instance small
+    __slots__ = ("embeddings", "id", "metadata", "text")
+
     def __init__(
         self,
         id: str,
@@ -1,5 +1,46 @@
+import array
+import asyncio
+import base64
+import contextlib
+import functools
+import threading
+import weakref
+from collections import OrderedDict
+from operator import attrgetter
+from typing import Any
+
 from datapizza.core.embedder import BaseEmbedder
 
+from openai import AsyncOpenAI, DefaultHttpxClient, OpenAI
+
+
+class _SharedHttpxClient(DefaultHttpxClient):
+    """Process-wide pool that the OpenAI clients using it cannot close.
+
+    OpenAI.close() closes the SDK's http client, which for a shared pool
+    would break every other embedder, so close() is a no-op here.
+    """
+
+    def close(self) -> None:
+        pass
+
+
+@functools.cache
+def _shared_http_client() -> _SharedHttpxClient:
+    """Pooled httpx client reused by every OpenAIEmbedder.
+
+    Sharing it keeps open TLS connections across embedder instances instead
+    of opening a new pool for each one, with the SDK's default limits.
+    """
+    return _SharedHttpxClient()
+
+
+_embedding_vector = attrgetter("embedding")
+
+
+def _decode_base64_vector(embedding: Any) -> list[float]:
+    return array.array("f", base64.b64decode(embedding.embedding)).tolist()
+
 
 class OpenAIEmbedder(BaseEmbedder):
     def __init__(
@@ -9,28 +50,92 @@ class OpenAIEmbedder(BaseEmbedder):
         model_name: str | None = None,
         base_url: str | None = None,
         encoding_format: str | None = None,
+        max_concurrency: int | None = None,
+        cache_size: int = 1024,
     ):
         self.api_key = api_key
         self.base_url = base_url
         self.model_name = model_name
         self.encoding_format = encoding_format
+        # Bounds in-flight a_embed requests, e.g. when a pipeline gathers
+        # many batches at once and would otherwise burst past rate limits
+        self.max_concurrency = max_concurrency
+        # One semaphore per event loop, as a semaphore binds to the loop it
+        # first waits on and embedders may be driven from several loops
+        self._a_limits: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        # LRU of recent vectors keyed by (model, text); 0 disables it
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, str], array.array] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
         self.client = None
         self.a_client = None
 
     def _set_client(self):
-        import openai
-
         if not self.client:
-            self.client = openai.OpenAI(api_key=self.api_key, base_url=self.base_url)
+            self.client = OpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=_shared_http_client(),
+            )
 
     def _set_a_client(self):
-        import openai
-
+        # Not shared: an async connection pool is bound to the event loop it
+        # first ran on, and embedders may be driven from different loops
         if not self.a_client:
-            self.a_client = openai.AsyncOpenAI(
-                api_key=self.api_key, base_url=self.base_url
-            )
+            self.a_client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+
+    def _a_limit(self) -> asyncio.Semaphore | contextlib.nullcontext:
+        if self.max_concurrency is None:
+            return contextlib.nullcontext()
+        loop = asyncio.get_running_loop()
+        limit = self._a_limits.get(loop)
+        if limit is None:
+            limit = self._a_limits[loop] = asyncio.Semaphore(self.max_concurrency)
+        return limit
+
+    def _vectors(self, data: list) -> list[list[float]]:
+        # The SDK decodes base64 itself only when no format is requested; an
+        # explicit "base64" comes back as little-endian float32 strings
+        if self.encoding_format == "base64":
+            return list(map(_decode_base64_vector, data))
+        return list(map(_embedding_vector, data))
+
+    def _lookup(
+        self, model: str, texts: list[str]
+    ) -> tuple[dict[str, list[float]], list[str]]:
+        """Split distinct texts into cached vectors and texts still to embed."""
+        found: dict[str, list[float]] = {}
+        misses: list[str] = []
+        with self._cache_lock:
+            for text in dict.fromkeys(texts):
+                vector = self._cache.get((model, text))
+                if vector is None:
+                    misses.append(text)
+                else:
+                    self._cache.move_to_end((model, text))
+                    found[text] = vector.tolist()
+        return found, misses
+
+    def _remember(
+        self, model: str, texts: list[str], vectors: list[list[float]]
+    ) -> None:
+        if not self.cache_size:
+            return
+        with self._cache_lock:
+            for text, vector in zip(texts, vectors, strict=True):
+                # Packed doubles take a fraction of the memory of a float list
+                self._cache[(model, text)] = array.array("d", vector)
+                self._cache.move_to_end((model, text))
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached embeddings."""
+        with self._cache_lock:
+            self._cache.clear()
 
     def embed(
         self, text: str | list[str], model_name: str | None = None
@@ -40,15 +145,22 @@ class OpenAIEmbedder(BaseEmbedder):
             raise ValueError("Model name is required.")
 
         texts = [text] if isinstance(text, str) else text
+        # Repeated and cached inputs are embedded, and billed, only once
+        found, misses = self._lookup(model, texts)
 
-        client = self._get_client()
+        if misses:
+            client = self._get_client()
 
-        kwargs: dict = {"input": texts, "model": model}
-        if self.encoding_format is not None:
-            kwargs["encoding_format"] = self.encoding_format
-        response = client.embeddings.create(**kwargs)
+            kwargs: dict = {"input": misses, "model": model}
+            if self.encoding_format is not None:
+                kwargs["encoding_format"] = self.encoding_format
+            response = client.embeddings.create(**kwargs)
 
-        embeddings = [embedding.embedding for embedding in response.data]
+            vectors = self._vectors(response.data)
+            self._remember(model, misses, vectors)
+            found.update(zip(misses, vectors, strict=True))
+
+        embeddings = [found[t] for t in texts]
         return embeddings[0] if isinstance(text, str) else embeddings
 
     async def a_embed(
@@ -59,12 +171,19 @@ class OpenAIEmbedder(BaseEmbedder):
             raise ValueError("Model name is required.")
 
         texts = [text] if isinstance(text, str) else text
+        found, misses = self._lookup(model, texts)
+
+        if misses:
+            client = self._get_a_client()
+            kwargs: dict = {"input": misses, "model": model}
+            if self.encoding_format is not None:
+                kwargs["encoding_format"] = self.encoding_format
+            async with self._a_limit():
+                response = await client.embeddings.create(**kwargs)
 
-        client = self._get_a_client()
-        kwargs: dict = {"input": texts, "model": model}
-        if self.encoding_format is not None:
-            kwargs["encoding_format"] = self.encoding_format
-        response = await client.embeddings.create(**kwargs)
+            vectors = self._vectors(response.data)
+            self._remember(model, misses, vectors)
+            found.update(zip(misses, vectors, strict=True))
 
-        embeddings = [embedding.embedding for embedding in response.data]
+        embeddings = [found[t] for t in texts]
         return embeddings[0] if isinstance(text, str) else embeddings
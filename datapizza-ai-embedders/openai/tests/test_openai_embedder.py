@@ -1,3 +1,8 @@
+import array
+import asyncio
+import base64
+from unittest.mock import Mock
+
 from datapizza.embedders.openai import OpenAIEmbedder
 
 
@@ -13,3 +18,102 @@ def test_openai_embedder_init_with_base_url():
     embedder = OpenAIEmbedder(api_key="test-key", base_url="https://api.openai.com/v1")
     assert embedder.api_key == "test-key"
     assert embedder.base_url == "https://api.openai.com/v1"
+
+
+def test_openai_embedders_share_sync_http_pool():
+    first = OpenAIEmbedder(api_key="shared-key", base_url="http://shared")
+    second = OpenAIEmbedder(api_key="other-key", base_url="http://other")
+
+    assert first._get_client()._client is second._get_client()._client
+
+    # Closing one SDK client must not close the pool under the other
+    first._get_client().close()
+    assert not second._get_client().is_closed()
+
+
+def test_openai_embedder_decodes_base64_vectors():
+    vector = [0.5, -1.25, 3.0]
+    payload = base64.b64encode(array.array("f", vector).tobytes()).decode()
+    client = Mock()
+    client.embeddings.create.return_value = Mock(data=[Mock(embedding=payload)])
+
+    embedder = OpenAIEmbedder(
+        api_key="test-key", model_name="test-model", encoding_format="base64"
+    )
+    embedder.client = client
+
+    assert embedder.embed("hello") == vector
+    assert client.embeddings.create.call_args.kwargs["encoding_format"] == "base64"
+
+
+def test_openai_embedder_bounds_async_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def create(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return Mock(data=[Mock(embedding=[1.0])])
+
+    client = Mock()
+    client.embeddings.create = create
+    embedder = OpenAIEmbedder(
+        api_key="test-key", model_name="test-model", max_concurrency=2
+    )
+    embedder.a_client = client
+
+    async def run():
+        return await asyncio.gather(*(embedder.a_embed("text") for _ in range(6)))
+
+    assert asyncio.run(run()) == [[1.0]] * 6
+    assert peak == 2
+
+    # A fresh event loop gets its own semaphore
+    embedder.clear_cache()
+    assert asyncio.run(run()) == [[1.0]] * 6
+
+
+def test_openai_embedder_sends_duplicate_texts_once():
+    client = Mock()
+    client.embeddings.create.return_value = Mock(
+        data=[Mock(embedding=[1.0]), Mock(embedding=[2.0])]
+    )
+    embedder = OpenAIEmbedder(api_key="test-key", model_name="test-model")
+    embedder.client = client
+
+    assert embedder.embed(["a", "b", "a"]) == [[1.0], [2.0], [1.0]]
+    assert client.embeddings.create.call_args.kwargs["input"] == ["a", "b"]
+
+
+def test_openai_embedder_caches_recent_embeddings():
+    client = Mock()
+    client.embeddings.create.side_effect = [
+        Mock(data=[Mock(embedding=[1.0]), Mock(embedding=[2.0])]),
+        Mock(data=[Mock(embedding=[3.0])]),
+        Mock(data=[Mock(embedding=[1.5])]),
+    ]
+    embedder = OpenAIEmbedder(api_key="test-key", model_name="test-model", cache_size=2)
+    embedder.client = client
+
+    assert embedder.embed(["a", "b"]) == [[1.0], [2.0]]
+    assert embedder.embed(["b", "c"]) == [[2.0], [3.0]]
+    assert client.embeddings.create.call_args.kwargs["input"] == ["c"]
+
+    # "a" was the least recently used entry and has been evicted
+    assert embedder.embed("a") == [1.5]
+    assert client.embeddings.create.call_count == 3
+
+
+def test_openai_embedder_cache_can_be_disabled():
+    client = Mock()
+    client.embeddings.create.return_value = Mock(data=[Mock(embedding=[1.0])])
+    embedder = OpenAIEmbedder(api_key="test-key", model_name="test-model", cache_size=0)
+    embedder.client = client
+
+    embedder.embed("a")
+    embedder.embed("a")
+
+    assert client.embeddings.create.call_count == 2
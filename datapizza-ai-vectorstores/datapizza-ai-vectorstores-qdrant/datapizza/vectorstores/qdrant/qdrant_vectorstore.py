@@ -2,6 +2,7 @@ import logging
 from collections.abc import Generator
 from typing import Any
 
+from datapizza.core.utils import gather_bounded
 from datapizza.core.vectorstore import VectorConfig, Vectorstore
 from datapizza.type import (
     Chunk,
@@ -43,6 +44,8 @@ class QdrantVectorstore(Vectorstore):
         self.client: QdrantClient
         self.a_client: AsyncQdrantClient
         self.batch_size: int = 100
+        # Upper bound on batch upserts a_add keeps in flight against the server
+        self.max_concurrency: int = 4
         self.host: str | None = host
         self.port: int = port
         self.api_key: str | None = api_key
@@ -80,15 +83,11 @@ class QdrantVectorstore(Vectorstore):
             raise ValueError("Collection name must be set")
 
         chunks = [chunk] if isinstance(chunk, Chunk) else chunk
-        points = []
+        points = [self._process_chunk(chunk) for chunk in chunks]
 
-        for chunk in chunks:
-            points.append(self._process_chunk(chunk))
-
-        # TODO: Process in batches
-        for p in points:
+        for batch in self._batch_points(points):
             try:
-                client.upsert(collection_name=collection_name, points=[p], wait=True)
+                client.upsert(collection_name=collection_name, points=batch, wait=True)
             except Exception as e:
                 log.error(f"Failed to add points to Qdrant: {e!s}")
                 raise e
@@ -102,20 +101,28 @@ class QdrantVectorstore(Vectorstore):
             raise ValueError("Collection name must be set")
 
         chunks = [chunk] if isinstance(chunk, Chunk) else chunk
-        points = []
+        points = [self._process_chunk(chunk) for chunk in chunks]
 
-        for chunk in chunks:
-            points.append(self._process_chunk(chunk))
+        try:
+            # Batches are independent upserts, so send a few at a time
+            await gather_bounded(
+                (
+                    client.upsert(
+                        collection_name=collection_name, points=batch, wait=True
+                    )
+                    for batch in self._batch_points(points)
+                ),
+                self.max_concurrency,
+            )
+        except Exception as e:
+            log.error(f"Failed to add points to Qdrant: {e!s}")
+            raise e
 
-        # TODO: Process in batches
-        for p in points:
-            try:
-                await client.upsert(
-                    collection_name=collection_name, points=[p], wait=True
-                )
-            except Exception as e:
-                log.error(f"Failed to add points to Qdrant: {e!s}")
-                raise e
+    def _batch_points(
+        self, points: list[models.PointStruct]
+    ) -> Generator[list[models.PointStruct], None, None]:
+        for i in range(0, len(points), self.batch_size):
+            yield points[i : i + self.batch_size]
 
     def _process_chunk(self, chunk: Chunk) -> models.PointStruct:
         """Process a chunk into a Qdrant point."""
@@ -1,4 +1,6 @@
+import asyncio
 import uuid
+from unittest.mock import Mock
 
 import pytest
 from datapizza.core.vectorstore import VectorConfig
@@ -43,6 +45,54 @@ def test_qdrant_vectorstore_add(vectorstore):
     assert len(res) == 1
 
 
+def test_qdrant_vectorstore_add_in_batches(vectorstore):
+    vectorstore.batch_size = 2
+    chunks = [
+        Chunk(
+            id=str(uuid.uuid4()),
+            text=f"Chunk {i}",
+            embeddings=[DenseEmbedding(name="dense_emb_name", vector=[0.1] * 1536)],
+        )
+        for i in range(5)
+    ]
+    vectorstore.add(chunks, collection_name="test")
+
+    res = vectorstore.search(collection_name="test", query_vector=[0.1] * 1536, k=10)
+    assert sorted(chunk.text for chunk in res) == [f"Chunk {i}" for i in range(5)]
+
+
+def test_qdrant_vectorstore_a_add_bounds_concurrent_upserts():
+    in_flight = 0
+    peak = 0
+    upserted = []
+
+    async def upsert(collection_name, points, wait):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        upserted.extend(point.payload["text"] for point in points)
+
+    vectorstore = QdrantVectorstore(location=":memory:")
+    vectorstore.a_client = Mock(upsert=upsert)
+    vectorstore.batch_size = 1
+    vectorstore.max_concurrency = 2
+    chunks = [
+        Chunk(
+            id=str(uuid.uuid4()),
+            text=f"Chunk {i}",
+            embeddings=[DenseEmbedding(name="dense_emb_name", vector=[0.1] * 4)],
+        )
+        for i in range(5)
+    ]
+
+    asyncio.run(vectorstore.a_add(chunks, collection_name="test"))
+
+    assert peak == 2
+    assert sorted(upserted) == [f"Chunk {i}" for i in range(5)]
+
+
 def test_create_collection_without_vector_name_and_query(vectorstore):
     vectorstore.create_collection(
         collection_name="unnamed_dense_test",